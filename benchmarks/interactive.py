@@ -0,0 +1,373 @@
+"""
+Headless benchmarks for the interactive helpers in mpl_utils.
+
+Each scenario builds a figure on the Agg backend, then replays a stream of
+synthetic mouse or key events (an "interaction" is one event, or a short
+sequence such as a click), timing each one.
+
+Run from the repo root:
+
+    python -m benchmarks.interactive
+    python -m benchmarks.interactive --full --save benchmarks/baseline.json
+    python -m benchmarks.interactive --compare benchmarks/baseline.json
+
+With --compare, any result with a p50 latency more than --threshold slower
+than the baseline is reported and the exit code is 1.
+"""
+
+import os
+
+os.environ["MPLBACKEND"] = "Agg"  # Before anything imports pyplot
+
+import argparse
+from collections.abc import Callable
+from datetime import datetime
+import itertools
+import json
+import platform
+import sys
+import time
+import tracemalloc
+import warnings
+
+import matplotlib
+from matplotlib import pyplot as plt
+from matplotlib.backend_bases import KeyEvent, MouseButton, MouseEvent
+import numpy as np
+import pandas as pd
+
+import mpl_utils
+from mpl_utils.charts.axes_tooltip import add_axes_tooltip
+
+# setup() sets the backend rcParam to TkAgg, so switch to Agg after it. Later
+# setup() calls (e.g. from chart()) only set the rcParam, so Agg stays in use.
+mpl_utils.setup()
+matplotlib.use("Agg")
+
+SERIES_COUNTS = [10, 100, 1000, 5000]
+POINT_COUNTS = [100, 1000, 100_000, 1_000_000]
+QUICK_MAX_TOTAL_POINTS = 100_000
+FULL_MAX_TOTAL_POINTS = 10_000_000
+
+# Big legends don't fit, which is fine for timing
+warnings.filterwarnings("ignore", "constrained_layout not applied")
+
+
+def process(*events):
+    for event in events:
+        event.canvas.callbacks.process(event.name, event)
+
+
+def make_lines(n_series, n_points, seed=0):
+    mpl_utils.setup()
+    fig, ax = plt.subplots(num="Benchmark", clear=True)
+    mpl_utils.clear_events()
+
+    rng = np.random.default_rng(seed)
+    x = np.arange(n_points)
+    y = rng.standard_normal((n_points, n_series)).cumsum(axis=0)
+    ax.plot(x, y, label=[f"Series {i}" for i in range(n_series)])
+
+    return fig, ax
+
+
+def sweep(ax, n_events, name="motion_notify_event") -> list[MouseEvent]:
+    """Mouse positions along a wave across the axes"""
+    ax.figure.canvas.draw()
+    xs = np.linspace(0.02, 0.98, n_events)
+    ys = 0.5 + 0.4 * np.sin(xs * 25)
+    return [
+        MouseEvent(name, ax.figure.canvas, *ax.transAxes.transform((x, y)))
+        for x, y in zip(xs, ys)
+    ]
+
+
+def click(ax) -> list[MouseEvent]:
+    x, y = ax.transAxes.transform((0.5, 0.5))
+    canvas = ax.figure.canvas
+    return [
+        MouseEvent("button_press_event", canvas, x, y, button=MouseButton.LEFT),
+        MouseEvent("button_release_event", canvas, x, y, button=MouseButton.LEFT),
+    ]
+
+
+# Each scenario builds its figure and returns a list of interactions to time
+
+
+def bench_custom_tooltip(n_series, n_points, n_events):
+    fig, ax = make_lines(n_series, n_points)
+
+    def get_text(event):
+        x = mpl_utils.get_closest_x(event)
+        artists = mpl_utils.get_artists_at_event(event)
+        return f"{x:g}: {len(artists)} lines" if artists else None
+
+    mpl_utils.add_custom_tooltip(ax, get_text=get_text)
+    return [lambda e=e: process(e) for e in sweep(ax, n_events)]
+
+
+def bench_dynamic_legend(n_series, n_points, n_events, use_blit=False):
+    fig, ax = make_lines(n_series, n_points)
+    mpl_utils.add_dynamic_legend(ax, use_blit=use_blit, loc="upper left")
+    return [lambda e=e: process(e) for e in sweep(ax, n_events)]
+
+
+def bench_dynamic_legend_blit(n_series, n_points, n_events):
+    return bench_dynamic_legend(n_series, n_points, n_events, use_blit=True)
+
+
+def bench_legend_tooltip(n_series, n_points, n_events):
+    fig, ax = make_lines(n_series, n_points)
+    mpl_utils.add_legend_tooltip(ax)
+    return [lambda e=e: process(e) for e in sweep(ax, n_events)]
+
+
+def bench_interactive_legend(n_series, n_points, n_events):
+    fig, ax = make_lines(n_series, n_points)
+    legend = mpl_utils.add_interactive_legend(ax, loc="upper left").legend
+    fig.canvas.draw()
+
+    # Hover over each legend entry that's on screen, then off the legend
+    positions = [
+        text.get_window_extent().get_points().mean(axis=0) for text in legend.texts
+    ]
+    positions = [p for p in positions if fig.bbox.contains(*p)]
+    positions.append(ax.transAxes.transform((0.9, 0.1)))
+    positions = list(itertools.islice(itertools.cycle(positions), n_events))
+
+    return [
+        lambda p=p: process(MouseEvent("motion_notify_event", fig.canvas, *p))
+        for p in positions
+    ]
+
+
+def bench_axes_tooltip(n_series, n_points, n_events):
+    fig, ax = make_lines(n_series, n_points)
+    lines = ax.get_lines()
+
+    def render(ax, tooltip_ax, event):
+        i = int(round(event.xdata))
+        y = lines[0].get_ydata()
+        tooltip_ax.plot(y[max(i - 50, 0) : i + 50])
+        return True
+
+    add_axes_tooltip(ax, render=render)
+    return [lambda e=e: process(e) for e in sweep(ax, n_events)]
+
+
+def bench_heatmap(n_series, n_points, n_events):
+    # A square-ish matrix, n_series rows and up to 2,000 columns
+    n_cols = min(n_points, 2000)
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        rng.random((n_series, n_cols)),
+        index=[f"Row {i}" for i in range(n_series)],
+        columns=[f"Col {i}" for i in range(n_cols)],
+    )
+    ax = mpl_utils.plot_heatmap(df, title="Benchmark")
+    return [lambda e=e: process(e) for e in sweep(ax, n_events)]
+
+
+def bench_searchable_scatter(n_series, n_points, n_events):
+    # n_points labelled points, typing then deleting a query
+    rng = np.random.default_rng(0)
+    labels = [f"Item {i}" for i in range(n_points)]
+    ax = mpl_utils.plot_searchable_scatter(
+        x=rng.random(n_points),
+        y=rng.random(n_points),
+        labels=labels,
+    )
+    fig = ax.figure
+    fig.canvas.draw()
+    text_box_ax = fig.axes[-1]
+    process(click(text_box_ax)[0])  # Start typing
+
+    query = "item 1234"
+    keys = list(query) + ["backspace"] * len(query)
+    keys = list(itertools.islice(itertools.cycle(keys), n_events))
+    x, y = text_box_ax.transAxes.transform((0.5, 0.5))
+
+    return [
+        lambda key=key: process(KeyEvent("key_press_event", fig.canvas, key, x, y))
+        for key in keys
+    ]
+
+
+def bench_paginated(n_series, n_points, n_events):
+    # n_series items, each a DataFrame of n_points rows
+    rng = np.random.default_rng(0)
+    items = [
+        (f"Item {i}", pd.DataFrame({"y": rng.standard_normal(n_points).cumsum()}))
+        for i in range(n_series)
+    ]
+
+    def render(ax, item):
+        name, df = item
+        ax.plot(df.y)
+        ax.set_title(name)
+
+    paginator = mpl_utils.plot_paginated(items=items, render=render)
+    paginator.fig.canvas.draw()
+    next_button_ax = paginator.next_button.ax
+
+    return [lambda: process(*click(next_button_ax)) for _ in range(n_events)]
+
+
+def bench_chart_layout(n_series, n_points, n_events):
+    # n_series spawned axes, each with one line of n_points
+    rng = np.random.default_rng(0)
+    y = rng.standard_normal(n_points).cumsum()
+
+    def build_chart():
+        with mpl_utils.chart("Benchmark", pan=False) as ax:
+            for _ in range(n_series):
+                ax.spawn().plot(y)
+        plt.gcf().canvas.draw()
+
+    return [build_chart for _ in range(n_events)]
+
+
+def bench_chart_rerun(n_series, n_points, n_events):
+    # Rerunning a chart block with reuse, with new data each time
+    rng = np.random.default_rng(0)
+    y = rng.standard_normal(n_points).cumsum()
+    runs = itertools.count()
+
+    def rerun_chart():
+        offset = next(runs)
+        with mpl_utils.chart("Benchmark", pan=False, reuse=True) as ax:
+            for i in range(n_series):
+                ax.spawn().plot(y + offset, label="y")
+        plt.gcf().canvas.draw()
+
+    return [rerun_chart for _ in range(n_events)]
+
+
+# name: (function, series counts, point counts, default events)
+SCENARIOS: dict[str, tuple[Callable, list, list, int]] = {
+    "custom_tooltip": (bench_custom_tooltip, SERIES_COUNTS, POINT_COUNTS, 200),
+    "dynamic_legend": (bench_dynamic_legend, [10, 100], POINT_COUNTS, 100),
+    "dynamic_legend_blit": (bench_dynamic_legend_blit, [10, 100], POINT_COUNTS, 100),
+    "legend_tooltip": (bench_legend_tooltip, SERIES_COUNTS, POINT_COUNTS, 200),
+    "interactive_legend": (bench_interactive_legend, [10, 100], POINT_COUNTS, 100),
+    "axes_tooltip": (bench_axes_tooltip, SERIES_COUNTS, POINT_COUNTS, 100),
+    "heatmap": (bench_heatmap, [10, 100, 1000, 2000], [10, 100, 2000], 100),
+    "searchable_scatter": (bench_searchable_scatter, [1], [100, 10_000, 1_000_000], 50),
+    "paginated": (bench_paginated, [10, 100, 1000], [100, 10_000], 20),
+    "chart_layout": (bench_chart_layout, [1, 4, 16, 30], [100, 10_000], 3),
+    "chart_rerun": (bench_chart_rerun, [1, 4, 16, 30], [100, 10_000], 3),
+}
+
+
+def run_scenario(name, n_series, n_points, n_events) -> dict:
+    func = SCENARIOS[name][0]
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    interactions = func(n_series, n_points, n_events)
+    setup_ms = (time.perf_counter() - start) * 1000
+    interactions[0]()  # Warm up caches and indexes
+    peak_mem_mb = tracemalloc.get_traced_memory()[1] / 1e6
+    tracemalloc.stop()
+
+    timings_ms = []
+    for interaction in interactions:
+        start = time.perf_counter()
+        interaction()
+        timings_ms.append((time.perf_counter() - start) * 1000)
+
+    plt.close("all")
+
+    timings_ms = np.array(timings_ms)
+    return dict(
+        scenario=name,
+        n_series=n_series,
+        n_points=n_points,
+        n_events=len(timings_ms),
+        setup_ms=setup_ms,
+        mean_ms=timings_ms.mean(),
+        p50_ms=np.percentile(timings_ms, 50),
+        p95_ms=np.percentile(timings_ms, 95),
+        p99_ms=np.percentile(timings_ms, 99),
+        max_ms=timings_ms.max(),
+        peak_mem_mb=peak_mem_mb,
+    )
+
+
+def compare(results: list[dict], baseline: dict, threshold: float) -> list[str]:
+    baseline_results = {
+        (r["scenario"], r["n_series"], r["n_points"]): r for r in baseline["results"]
+    }
+    regressions = []
+    for result in results:
+        key = (result["scenario"], result["n_series"], result["n_points"])
+        if old := baseline_results.get(key):
+            if result["p50_ms"] > old["p50_ms"] * (1 + threshold):
+                regressions.append(
+                    f"{key}: p50 {old['p50_ms']:.2f} ms -> {result['p50_ms']:.2f} ms"
+                )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("scenarios", nargs="*", help=", ".join(SCENARIOS))
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help=f"Include sizes up to {FULL_MAX_TOTAL_POINTS:,} total points",
+    )
+    parser.add_argument("--events", type=int, help="Override events per run")
+    parser.add_argument("--save", help="Write results to this JSON file")
+    parser.add_argument("--compare", help="Compare against this JSON baseline")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    if unknown := set(args.scenarios) - set(SCENARIOS):
+        parser.error(f"Unknown scenarios: {', '.join(unknown)}")
+
+    max_total_points = FULL_MAX_TOTAL_POINTS if args.full else QUICK_MAX_TOTAL_POINTS
+
+    results = []
+    for name in args.scenarios or SCENARIOS:
+        _, series_counts, point_counts, n_events = SCENARIOS[name]
+        for n_series, n_points in itertools.product(series_counts, point_counts):
+            if n_series * n_points > max_total_points:
+                continue
+            result = run_scenario(name, n_series, n_points, args.events or n_events)
+            print(
+                f"{name:20} {n_series:>6,} series {n_points:>10,} points"
+                f"  p50 {result['p50_ms']:8.2f} ms  p95 {result['p95_ms']:8.2f} ms"
+                f"  mem {result['peak_mem_mb']:8.1f} MB"
+            )
+            results.append(result)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(
+                dict(
+                    created=datetime.now().isoformat(timespec="seconds"),
+                    python=sys.version.split()[0],
+                    platform=platform.platform(),
+                    matplotlib=matplotlib.__version__,
+                    numpy=np.__version__,
+                    pandas=pd.__version__,
+                    results=results,
+                ),
+                f,
+                indent=2,
+            )
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        if regressions:
+            print("\nRegressions:", *regressions, sep="\n  ")
+            return 1
+        print("\nNo regressions")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,8 @@
+import contextlib
+import functools
 from typing import Union
 
+import matplotlib
 from matplotlib import pyplot as plt
 from matplotlib.axes import Axes
 from matplotlib.backend_bases import MouseEvent
@@ -12,11 +15,19 @@ import pandas as pd
 from pandas.plotting._matplotlib.converter import TimeSeries_DateLocator
 
 # EventsMixin must come before modules that use it.
+from .profiling import add_profiler, get_profiler, profile
+from .data_index import DataIndex, get_data_index
+from .hit_index import HitIndex, get_hit_index, get_artists_at_event
+from .decimation import DecimatedLine, plot_decimated, decimate_lines
+from .series_collection import SeriesCollection, collect_series
+from .search_index import SearchIndex
 from .event_helpers import EventsMixin  # Added in #509
+from .event_helpers import EventDispatcher, get_event_dispatcher
 from .text_zoom import add_text_zoom  # Added in #503
 from .interactive_legend import add_interactive_legend  # Added in #506
 from .dynamic_legend import add_dynamic_legend  # Added in #508
 from .custom_tooltip import add_custom_tooltip  # Added in #602
+from .streaming import add_stream
 from .legend_tooltip import add_legend_tooltip  # Added in #604
 from .mplcursors_tooltip import add_mplcursors_tooltip  # Added in #605
 from .layouts import flex_subplots, add_axes_px  # Added in #702 and #703
@@ -39,15 +50,62 @@ def configure_figure(fig):
         pass
 
 
+# The rcParams as last left by `setup()`, to detect when it's still applied
+_setup_rc_params = None
+
+
 # Added in #401
 def setup(font_bump=1):
+    """
+    Reset rcParams to the defaults, then apply the mpl_utils style.
+
+    If nothing has changed the rcParams since the last call with the same
+    `font_bump`, this does nothing, so calling it for each new chart is cheap.
+    """
+    global _setup_rc_params
+
+    style = {
+        "backend": "TkAgg",
+        "interactive": True,
+        **get_style(font_bump),
+    }
+    if _setup_rc_params is not None:
+        # Compare the raw values, which skips validation and backend resolution
+        rc_params = dict(dict.items(plt.rcParams))
+        if rc_params == _setup_rc_params and all(
+            rc_params[key] == value for key, value in style.items()
+        ):
+            return
+
     plt.rcdefaults()
+    plt.rcParams.update(style)
+    _setup_rc_params = dict(dict.items(plt.rcParams))
+
+
+@contextlib.contextmanager
+def style_context(font_bump=1):
+    """
+    Apply the mpl_utils style (see `setup()`) until the end of the with block.
 
+    Unlike `setup()`, other rcParams aren't reset to the defaults, and the
+    backend isn't changed, so only the style's own rcParams are set, then
+    restored afterwards.
+    """
+    with matplotlib.rc_context(get_style(font_bump)):
+        yield
+
+
+@functools.cache
+def get_style(font_bump=1) -> dict:
+    """
+    Return the mpl_utils style rcParams (built once per `font_bump`).
+    The returned dict is shared, so shouldn't be modified.
+    """
     # This cycler will cycle through the default colors with a plain line,
     # then again for a dashed line, and again for a dotted line
     prop_cycle = (
         plt.cycler("linestyle", ["-", "--", ":", "-."])
-        * plt.rcParams["axes.prop_cycle"]
+        * matplotlib.rcParamsDefault["axes.prop_cycle"]
     )
 
     blue_gray_100 = "#cfd8dc"
@@ -56,11 +114,8 @@ def setup(font_bump=1):
     blue_gray_900 = "#263238"
     blue_gray_950 = "#1d272b"
 
-    plt.rcParams.update(
+    return matplotlib.RcParams(
         {
-            # Window config
-            "backend": "TkAgg",
-            "interactive": True,
             # Layout
             "figure.figsize": (10, 10),  # Avoid layout collapse
             "figure.constrained_layout.use": True,
@@ -127,6 +182,10 @@ def clear_events(fig=None):
     """
     fig = fig or plt.gcf()
 
+    # Helpers connect through the figure's dispatcher, so clear it too
+    if dispatcher := getattr(fig, "_event_dispatcher_ref", None):
+        dispatcher.clear()
+
     # Get all the CIDs in the callback registry
     cids = []
     for cb_dict in fig.canvas.callbacks.callbacks.values():
@@ -192,21 +251,14 @@ def get_x_values_from_ax(ax: Axes):
     an empty list is returned.
     - The x-values are extracted from Line2D objects (representing
     lines) and PathCollection objects (representing scatter plots).
+    - The values come from the axes' cached `DataIndex`, so repeated calls
+    are cheap until artists are added, removed or given new data.
     """
-    unique_x_values = set()
-
-    for artist in ax.get_children():
-        if isinstance(artist, Line2D):
-            unique_x_values.update(artist.get_xdata(orig=False))
-        elif isinstance(artist, PathCollection):
-            x_data = artist.get_offsets()[:, 0]
-            unique_x_values.update(x_data)
-
-    return sorted(unique_x_values)
+    return get_data_index(ax).x_values.tolist()
 
 
 # Added in #508
-def get_closest(options, target):
+def get_closest(options, target, assume_sorted=False):
     """
     Finds and returns the element from a given array of options that is closest to a
     specified target value, ignoring any NaN values in the array.
@@ -218,6 +270,9 @@ def get_closest(options, target):
         array are ignored.
     target : float
         The target value to which the closest element in the `options` array is sought.
+    assume_sorted : bool, default False
+        If True, `options` must be sorted in ascending order without NaN values, and
+        the closest element is found with a binary search.
 
     Returns
     -------
@@ -230,7 +285,16 @@ def get_closest(options, target):
     The function converts the input `options` to a NumPy array and filters out NaN
     values. It then calculates the absolute differences between the non-NaN elements
     and the target, returning the element with the minimum difference.
+    With `assume_sorted`, `np.searchsorted` is used instead, so the cost is O(log n).
     """
+    if assume_sorted:
+        i = np.searchsorted(options, target)
+        if i == len(options):
+            return options[i - 1]
+        if i > 0 and target - options[i - 1] <= options[i] - target:
+            return options[i - 1]
+        return options[i]
+
     options = np.asarray(options)
     options = options[~np.isnan(options)]
     diffs = np.abs(options - target)
@@ -244,8 +308,7 @@ def get_closest_x(event: MouseEvent):
     if not ax:
         return
 
-    x_values = get_x_values_from_ax(ax)
-    x_value = get_closest(x_values, event.xdata)
+    x_value = get_data_index(ax).get_closest_x(event.xdata)
 
     # Added in #510
     if isinstance(ax.xaxis.get_major_locator(), TimeSeries_DateLocator):
@@ -290,7 +353,9 @@ def get_y_at_x(artist: Union[Line2D, PathCollection], x):
     # This will convert dates to floats
     x = artist.convert_xunits(x)
 
-    if isinstance(artist, Line2D):
+    if isinstance(artist, DecimatedLine):
+        x_data, y_data = artist.get_full_data()
+    elif isinstance(artist, Line2D):
         x_data, y_data = artist.get_data(orig=False)
     elif isinstance(artist, PathCollection):
         x_data, y_data = artist.get_offsets().T
@@ -304,6 +369,35 @@ def get_y_at_x(artist: Union[Line2D, PathCollection], x):
         return float("nan")
 
 
+def get_y_values_at_x(ax: Axes, x) -> dict:
+    """
+    Get the y-coordinate of every Line2D and PathCollection artist in an Axes
+    at a given x-coordinate, in one lookup.
+
+    Parameters
+    ----------
+    ax : Axes
+        The matplotlib Axes object containing the artists.
+    x : float or int or datetime
+        The x-coordinate for which the corresponding y-coordinates are desired.
+
+    Returns
+    -------
+    dict
+        A mapping of each artist to its y-coordinate at `x`. Artists with no point
+        at `x` map to NaN.
+
+    Notes
+    -----
+    This gives the same values as calling `get_y_at_x` for each artist, but reads
+    a single row of the axes' cached `DataIndex` rather than scanning each artist.
+    """
+    index = get_data_index(ax)
+    y_values = index.get_y_values(ax.xaxis.convert_units(x))
+
+    return dict(zip(index.artists, y_values.tolist()))
+
+
 # Added in #602
 def bold(val):
     return rf"$\mathbf{{{val}}}$"
@@ -1,32 +1,58 @@
+from collections import defaultdict
 from collections.abc import Callable
 import contextlib
+from functools import partial
 import math
+import re
+import time
 
 from matplotlib import pyplot as plt
 from matplotlib.axes import Axes
 from matplotlib.backend_bases import MouseEvent
+from matplotlib.collections import PathCollection
 from matplotlib.layout_engine import ConstrainedLayoutEngine
+from matplotlib.lines import Line2D
 from matplotlib.transforms import Bbox
 import pandas as pd
 
 import mpl_utils
+from mpl_utils.layouts import get_decoration_key, get_figure_decoration_key
+from mpl_utils.profiling import count
 
 
 # Added in #902
 class FastLayoutEngine(ConstrainedLayoutEngine):
+    """
+    A constrained layout engine that doesn't re-run while the cursor is in the
+    figure, and when it does run, only re-solves the layout if needed.
+
+    Each axes' decorations are described by a cheap key (see
+    `get_decoration_key`). When only some keys change, e.g. after a scroll
+    zoom changes one subplot's tick labels, only those axes are measured, and
+    the layout is kept if their decorations still fit the space the last
+    solve gave them.
+    """
+
     def __init__(self, fig=None):
         super().__init__()
 
         self.enabled = True
         self.timer = None
+        self.layoutgrids = None
+        self.figure_key = None
+        self.decoration_keys = {}
+
+        self.fig = fig or plt.gcf()
+        self.connect()
 
-        fig = fig or plt.gcf()
-        self.fig = fig
-        fig.canvas.mpl_connect("figure_enter_event", self.on_figure_enter)
-        fig.canvas.mpl_connect("figure_leave_event", self.on_figure_leave)
-        fig.canvas.mpl_connect("button_release_event", self.force_execute)
-        fig.canvas.mpl_connect("key_release_event", self.force_execute)
-        fig.canvas.mpl_connect("scroll_event", self.on_scroll)
+    def connect(self):
+        # Also used to reconnect, after `clear_events()`
+        canvas = self.fig.canvas
+        canvas.mpl_connect("figure_enter_event", self.on_figure_enter)
+        canvas.mpl_connect("figure_leave_event", self.on_figure_leave)
+        canvas.mpl_connect("button_release_event", self.force_execute)
+        canvas.mpl_connect("key_release_event", self.force_execute)
+        canvas.mpl_connect("scroll_event", self.on_scroll)
 
     def on_figure_enter(self, _):
         self.enabled = False
@@ -45,23 +71,91 @@ class FastLayoutEngine(ConstrainedLayoutEngine):
         self.timer.start()
 
     def force_execute(self, event=None):
-        super().execute(self.fig)
+        self.execute_if_needed(self.fig)
         self.fig.canvas.draw_idle()
 
     def execute(self, fig):
         if self.enabled:
-            super().execute(fig)
+            self.execute_if_needed(fig)
+
+    def execute_if_needed(self, fig):
+        with mpl_utils.profile(fig, "layout"):
+            keys = {ax: get_decoration_key(ax) for ax in fig.axes}
+            figure_key = (
+                fig.bbox.bounds,
+                tuple(keys),
+                tuple(ax.get_subplotspec() for ax in keys),
+                get_figure_decoration_key(fig),
+            )
+            changed_axes = [
+                ax for ax, key in keys.items() if key != self.decoration_keys.get(ax)
+            ]
+
+            if (
+                figure_key != self.figure_key
+                or self.layoutgrids is None
+                or fig.subfigs
+                or not self.decorations_fit(fig, changed_axes)
+            ):
+                self.layoutgrids = super().execute(fig)
+                count(fig, "layout.solved")
+            else:
+                count(fig, "layout.skipped")
+
+            self.figure_key = figure_key
+            self.decoration_keys = keys
+
+    def decorations_fit(self, fig, axes: list[Axes]):
+        """
+        Whether each axes' decorations are inside the outer bounds of its
+        grid cells, as of the last solve.
+        """
+        renderer = fig._get_renderer()
+
+        for ax in axes:
+            subplot_spec = ax.get_subplotspec()
+            if subplot_spec is None:
+                return False  # E.g. colorbars, which the solver places itself
+
+            layoutgrid = self.layoutgrids.get(subplot_spec.get_gridspec())
+            if layoutgrid is None:
+                return False
+
+            outer = layoutgrid.get_outer_bbox(
+                rows=subplot_spec.rowspan, cols=subplot_spec.colspan
+            )
+            tight = ax.get_tightbbox(renderer)
+            if tight is None:
+                continue
+            tight = tight.transformed(fig.transFigure.inverted())
+
+            if (
+                tight.x0 < outer.x0
+                or tight.y0 < outer.y0
+                or tight.x1 > outer.x1
+                or tight.y1 > outer.y1
+            ):
+                return False
+
+        return True
 
 
 # Added in #903
 class add_zoom_on_scroll:
-    def __init__(self, fig=None):
+    def __init__(self, fig=None, settle_ms=100):
+        """
+        While scrolling, any DecimatedLines in the axes draw a coarse
+        precomputed level of detail, then full detail once scrolling has
+        stopped for `settle_ms`.
+        """
         self.fig = fig or plt.gcf()
+        self.settle_ms = settle_ms
         self.fig.canvas.mpl_connect("scroll_event", self.on_scroll)
         self.fig.canvas.mpl_connect("button_press_event", self.on_mouse_down)
         self.fig._scroll_on_zoom_ref = self
 
         self.timer = None
+        self.draft_lines = set()
 
     def on_scroll(self, event: MouseEvent):
         ax = event.inaxes
@@ -94,6 +188,32 @@ class add_zoom_on_scroll:
 
         self.fig.canvas.toolbar.push_current()
 
+        self.start_draft(ax)
+        self.fig.canvas.draw_idle()
+
+    def start_draft(self, ax: Axes):
+        for line in ax.get_lines():
+            if isinstance(line, mpl_utils.DecimatedLine):
+                line.draft = True
+                self.draft_lines.add(line)
+
+        if not self.draft_lines:
+            return
+
+        # Like FastLayoutEngine, wait for scrolling to stop
+        if self.timer:
+            self.timer.stop()
+
+        self.timer = self.fig.canvas.new_timer(self.settle_ms)
+        self.timer.single_shot = True
+        self.timer.add_callback(self.end_draft)
+        self.timer.start()
+
+    def end_draft(self):
+        self.timer = None
+        for line in self.draft_lines:
+            line.draft = False
+        self.draft_lines.clear()
         self.fig.canvas.draw_idle()
 
     def on_mouse_down(self, event: MouseEvent):
@@ -102,8 +222,143 @@ class add_zoom_on_scroll:
             self.fig.canvas.draw_idle()
 
 
+def _get_reuse_key(artist):
+    label = artist.get_label()
+    # Unlabelled artists get a label from their position among the children
+    if not label or re.fullmatch(r"_child\d+", label):
+        label = None
+    return type(artist), label
+
+
+# Axes properties that `ax.clear()` leaves as they were, and are set to those
+# of a new axes instead
+_AXES_PROPERTIES = [
+    "facecolor",
+    "axisbelow",
+    "aspect",
+    "adjustable",
+    "anchor",
+    "box_aspect",
+    "frame_on",
+    "navigate",
+    "alpha",
+    "zorder",
+    "rasterized",
+    "visible",
+    "in_layout",
+    "label",
+]
+
+# Set to None by `Figure.clear()`, but there's no public way to unset them
+_FIGURE_TEXT_ATTRIBUTES = ["_suptitle", "_supxlabel", "_supylabel"]
+
+
+def can_reset_figure(fig) -> bool:
+    return not fig.subfigs and all(
+        hasattr(fig, name) for name in _FIGURE_TEXT_ATTRIBUTES
+    )
+
+
+def reset_figure(fig):
+    """
+    Remove the figure-level artists (texts, including the suptitle, supxlabel
+    and supylabel, legends and others), as `Figure.clear()` does, but keep the
+    axes.
+    """
+    for artist in [
+        *fig.texts,
+        *fig.legends,
+        *fig.artists,
+        *fig.lines,
+        *fig.patches,
+        *fig.images,
+    ]:
+        artist.remove()
+    for name in _FIGURE_TEXT_ATTRIBUTES:
+        setattr(fig, name, None)
+
+
+class ReusedAxes:
+    """
+    An axes from a previous run of a chart, reset to the state of a new axes
+    (with `ax.clear()`) to be plotted on again.
+
+    The previous run's artists are taken out of the axes, but lines and
+    scatters added by the new run are matched to them by type and label, in
+    order. A match takes the new data and style (and, as the new artist isn't
+    in the axes yet, its unset transform and clip path, which the axes then
+    sets), then goes in the axes instead, so it's the same artist as before.
+    """
+
+    def __init__(self, ax: Axes, new_ax: Axes):
+        """
+        `new_ax` is an axes (not in the figure) with the properties a new
+        axes would have.
+        """
+        self.ax = ax
+        self.title = ax.get_title(plt.rcParams["axes.titlelocation"])
+        self.old_artists = defaultdict(list)
+        for artist in [*ax.lines, *ax.collections, *ax.patches, *ax.images, *ax.texts]:
+            self.old_artists[_get_reuse_key(artist)].append(artist)
+            artist.remove()
+
+        for child_ax in list(ax.child_axes):  # E.g. colorbars
+            child_ax.remove()
+
+        # Back to the state of a new axes: titles, labels, legend, scales,
+        # ticks, limits, color cycle and the rest, except as below
+        ax.clear()
+        ax.set(
+            **{name: getattr(new_ax, f"get_{name}")() for name in _AXES_PROPERTIES}
+        )
+        ax.axison = new_ax.axison
+
+        # Instance attributes, so plotting methods call these instead
+        ax.add_line = self.add_line
+        ax.add_collection = self.add_collection
+
+    def take_old_artist(self, artist):
+        old_artists = self.old_artists.get(_get_reuse_key(artist))
+        if old_artists:
+            return old_artists.pop(0)
+
+    def add_line(self, line: Line2D):
+        # Animated lines (e.g. from add_stream) are kept, as they're updated
+        # through the returned line
+        old_line = None
+        if type(line) is Line2D and not line.get_animated():
+            old_line = self.take_old_artist(line)
+        if old_line is not None:
+            old_line.update_from(line)
+            old_line.set_zorder(line.get_zorder())
+            old_line.set_data(*line.get_data(orig=True))
+            line = old_line
+
+        return Axes.add_line(self.ax, line)
+
+    def add_collection(self, collection, autolim=True):
+        old = None
+        if type(collection) is PathCollection:
+            old = self.take_old_artist(collection)
+        if old is not None:
+            old.update_from(collection)
+            old.set_zorder(collection.get_zorder())
+            old.set_paths(collection.get_paths())
+            old.set_sizes(collection.get_sizes())
+            old.set_offsets(collection.get_offsets())
+            collection = old
+
+        return Axes.add_collection(self.ax, collection, autolim=autolim)
+
+    def finish(self):
+        del self.ax.add_line
+        del self.ax.add_collection
+        self.old_artists.clear()
+
+
 class AxesWithSpawn(Axes):
     spawn: Callable[[], Axes]
+    stream: Callable[..., mpl_utils.add_stream]
 
 
 # Added in #901
@@ -114,28 +369,107 @@ class chart:
         ncols=None,
         tooltips=True,
         pan=True,
+        profile=False,
+        decimate=False,
+        collect_series=False,
+        reuse=False,
         **kwargs,
     ):
+        """
+        `profile` can be True to record timings (see `mpl_utils.add_profiler`),
+        or "overlay" to also show them on the figure.
+
+        With `decimate`, lines with many points are replaced with DecimatedLines,
+        so drawing costs depend on the axes width rather than the point count.
+
+        With `collect_series`, axes with many plain lines (e.g. one per column of
+        a wide DataFrame) draw them all in one call with a SeriesCollection.
+
+        With `reuse`, rerunning a chart block updates the existing figure rather
+        than rebuilding it. Axes are reused in the order they're spawned, or by
+        title (see `spawn`), and their lines and scatters are updated in place
+        where the new run plots one with the same label (see `ReusedAxes`).
+        """
         self.tooltips = tooltips
+        self.decimate = decimate
+        self.collect_series = collect_series
         self.ncols = ncols
+        self.kwargs = kwargs
         self.existing_figure = name in plt.get_figlabels()
 
+        start = time.perf_counter()
         mpl_utils.setup()
-        self.fig, self.ax = plt.subplots(num=name, clear=True, **kwargs)
+
+        self.previous = None
+        if reuse and self.existing_figure:
+            self.previous = self.get_previous_chart(plt.figure(num=name))
+
+        # Old axes, in order, not yet spawned by this run
+        self.reusable_axes: dict[Axes, ReusedAxes] = {}
+        if self.previous:
+            self.fig = self.previous.fig
+            # Other axes the previous run added, e.g. colorbars, before their
+            # mappables are taken out of the reused axes
+            for ax in self.fig.axes:
+                if ax not in self.previous.axs:
+                    ax.remove()
+            reset_figure(self.fig)
+            new_ax = type(self.previous.ax)(self.fig, self.previous.ax.get_position())
+            self.reusable_axes = {
+                ax: ReusedAxes(ax, new_ax) for ax in self.previous.axs
+            }
+            self.ax = next(iter(self.reusable_axes))
+            self.reused_axes = [self.reusable_axes.pop(self.ax)]
+        else:
+            self.fig, self.ax = plt.subplots(num=name, clear=True, **kwargs)
+            self.reused_axes = []
         mpl_utils.clear_events()
+
+        if profile:
+            self.profiler = mpl_utils.add_profiler(
+                self.fig, overlay=profile == "overlay"
+            )
+            self.profiler.timings["chart.setup"].append(time.perf_counter() - start)
+        elif profiler := mpl_utils.get_profiler(self.fig):
+            profiler.remove()  # From a previous run
+
         mpl_utils.add_text_zoom()
 
         if pan and not self.existing_figure:
             self.fig.canvas.toolbar.pan()
 
         self.axs = [self.ax]
+        self.grid_spec = None
+        self.layout_engine = None
+        self.tooltip_cursor = None
+        self.fig._chart_ref = self
+
+    def get_previous_chart(self, fig):
+        previous = getattr(fig, "_chart_ref", None)
+        if (
+            previous is None
+            or previous.kwargs != self.kwargs
+            or previous.layout_engine is not fig.get_layout_engine()
+            or any(ax not in fig.axes for ax in previous.axs)
+            or not can_reset_figure(fig)
+        ):
+            return None
+        return previous
 
     def __enter__(self) -> AxesWithSpawn:
         # Slightly dodgy monkey-patching of `Axes`
         self.ax.spawn = self.spawn
+        self.ax.stream = partial(mpl_utils.add_stream, self.ax)
         return self.ax
 
     def __exit__(self, *args):
+        with mpl_utils.profile(self.fig, "chart.exit"):
+            self.finalize()
+
+    def finalize(self):
+        if self.previous:
+            self.finish_reuse()
+
         ax_count = len(self.axs)
         if self.ncols:
             ncols = min(self.ncols, ax_count)
@@ -143,13 +477,28 @@ class chart:
             ncols = math.floor(math.sqrt(ax_count))
         nrows = math.ceil(ax_count / ncols)
 
-        grid_spec = self.fig.add_gridspec(nrows=nrows, ncols=ncols)
+        # The same grid keeps the layout engine's cached layout valid
+        grid_spec = self.previous and self.previous.grid_spec
+        if grid_spec is None or grid_spec.get_geometry() != (nrows, ncols):
+            grid_spec = self.fig.add_gridspec(nrows=nrows, ncols=ncols)
+        self.grid_spec = grid_spec
 
         for ax, subplot_spec in zip(self.axs, grid_spec):
             ax.set_subplotspec(subplot_spec)
 
+            if self.decimate:
+                mpl_utils.decimate_lines(ax)
+
+            if self.collect_series:
+                mpl_utils.collect_series(ax)
+
+        if self.previous and self.previous.tooltip_cursor:
+            self.previous.tooltip_cursor.remove()
+
         if self.tooltips:
-            mpl_utils.add_mplcursors_tooltip(pickables=self.fig)
+            self.tooltip_cursor = mpl_utils.add_mplcursors_tooltip(
+                pickables=self.fig
+            )
 
         if self.existing_figure:
             with contextlib.suppress(AttributeError):
@@ -160,14 +509,61 @@ class chart:
             self.fig.show()
 
         add_zoom_on_scroll(self.fig)  # Added in 903
-        self.fig.set_layout_engine(FastLayoutEngine(self.fig))  # Added in 902
 
-    def spawn(self):
-        if not self.ax.has_data():
+        if self.previous:
+            self.layout_engine = self.previous.layout_engine
+            self.layout_engine.connect()
+        else:
+            self.layout_engine = FastLayoutEngine(self.fig)  # Added in 902
+            self.fig.set_layout_engine(self.layout_engine)
+
+        self.previous = None  # Don't keep every run alive
+
+    def finish_reuse(self):
+        # Previous axes that this run didn't spawn
+        for ax in self.reusable_axes:
+            ax.remove()
+        self.reusable_axes.clear()
+
+        for reused_axes in self.reused_axes:
+            reused_axes.finish()
+
+        if len(self.axs) > 1 and not self.ax.has_data():
+            self.axs.remove(self.ax)
+            self.ax.remove()
+
+    def spawn(self, title: str = None):
+        """
+        With `title`, the axes' title is set, and when reusing a figure, the
+        previous run's axes with the same title is used (if any).
+        """
+        new_ax = self.get_reusable_axes(title)
+        if new_ax is None:
+            new_ax = self.fig.add_subplot()
+            new_ax.stream = partial(mpl_utils.add_stream, new_ax)
+            self.axs.append(new_ax)
+        elif new_ax is not self.ax:
+            self.axs.append(new_ax)
+
+        if title is not None:
+            new_ax.set_title(title)
+        return new_ax
+
+    def get_reusable_axes(self, title: str = None):
+        matches = [
+            ax
+            for ax, reused_axes in self.reusable_axes.items()
+            if title is not None and reused_axes.title == title
+        ]
+        if not matches and not self.ax.has_data():
             return self.ax
 
-        new_ax = self.fig.add_subplot()
-        self.axs.append(new_ax)
+        if not matches and not self.reusable_axes:
+            return None
+
+        new_ax = matches[0] if matches else next(iter(self.reusable_axes))
+        self.reused_axes.append(self.reusable_axes.pop(new_ax))
+        new_ax.stream = partial(mpl_utils.add_stream, new_ax)
         return new_ax
 
 
@@ -1,4 +1,5 @@
-from collections.abc import Callable
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
 
 import pandas as pd
 from matplotlib import pyplot as plt
@@ -7,6 +8,7 @@ from matplotlib.backend_bases import MouseEvent
 from matplotlib.transforms import Bbox
 
 import mpl_utils
+from mpl_utils.custom_tooltip import Blitter
 
 
 class add_axes_tooltip(mpl_utils.EventsMixin):
@@ -17,6 +19,10 @@ class add_axes_tooltip(mpl_utils.EventsMixin):
         width=300,
         height=185,
         alpha=0.9,
+        max_fps: float = None,
+        get_key: Callable[[Axes, MouseEvent], Hashable] = None,
+        use_blit=True,
+        max_cached=100,
     ):
         """
         Parameters
@@ -33,49 +39,93 @@ class add_axes_tooltip(mpl_utils.EventsMixin):
             The height of the tooltip axes in pixels. Default is 185.
         alpha : float, optional
             The transparency of the tooltip axes. Default is 0.9.
+        max_fps : float, optional
+            If set, mouse moves are coalesced and handled at most this many times
+            a second. Default is None (every mouse move is handled).
+        get_key : callable, optional
+            A function that accepts `ax` and `event` and returns a value
+            describing what the tooltip would show, e.g. the hovered heatmap cell.
+            `render` is only called when the key changes, and with blitting,
+            the rendered tooltips for up to `max_cached` keys are kept as images.
+        use_blit : bool, optional
+            Whether to blit the tooltip axes, rather than redraw the figure.
+            Default is True, if the canvas supports it.
+        max_cached : int, optional
+            The number of rendered tooltip images to keep. Default is 100.
         """
-        super().__init__(ax)
+        super().__init__(ax, max_fps=max_fps)
         self.ax = ax
         self.render = render
         self.fig = ax.figure
         self.width = width
         self.height = height
         self.alpha = alpha
+        self.get_key = get_key
+        self.max_cached = max_cached
+        self.cache = OrderedDict()  # {key: (show tooltip, image or None)}
+        self.rendered_key = None
 
+        use_blit = use_blit and self.fig.canvas.supports_blit
         self.tooltip_ax = self.fig.add_axes(
             rect=(0, 0, 1, 1),
             visible=False,
+            animated=use_blit,
         )
 
+        self.blitter = None
+        if use_blit:
+            self.blitter = Blitter(self.fig)
+            # Cached images include a little of what's behind the tooltip
+            self.dispatcher.subscribe("draw_event", self.clear_images)
+
         self.tooltip_ax.set_facecolor(plt.rcParams["grid.color"])
         self.tooltip_ax.spines[:].set_visible(True)
         self.tooltip_ax.spines[:].set_color(plt.rcParams["text.color"])
         self.tooltip_ax.spines[:].set_linewidth(0.5)
 
-        self.fig.canvas.mpl_connect("motion_notify_event", self.on_mouse_move)
+        self.connect_motion(self.on_mouse_move)
         ax._add_axes_tooltip_ref = self
 
     def on_mouse_move(self, event: MouseEvent):
         if event.inaxes != self.ax:
             return
 
-        self.tooltip_ax.clear()
-        self.tooltip_ax.patch.set_alpha(self.alpha)
+        key = self.get_key(self.ax, event) if self.get_key else None
 
-        show_tooltip = self.render(self.ax, self.tooltip_ax, event)
+        if key is not None and key in self.cache:
+            self.cache.move_to_end(key)
+            show_tooltip, image = self.cache[key]
+        else:
+            show_tooltip = self.render_tooltip_ax(event, key)
+            image = None
 
         if show_tooltip:
-            self.show_tooltip_ax(event)
+            self.show_tooltip_ax(event, key, image)
         else:
             self.hide_tooltip_ax()
 
-    def show_tooltip_ax(self, event):
+    def render_tooltip_ax(self, event: MouseEvent, key: Hashable) -> bool:
+        with mpl_utils.profile(self.fig, "axes_tooltip.render"):
+            self.tooltip_ax.clear()
+            self.tooltip_ax.patch.set_alpha(self.alpha)
+            show_tooltip = self.render(self.ax, self.tooltip_ax, event)
+
+        self.rendered_key = key
+        if key is not None:
+            self.cache[key] = (show_tooltip, None)
+            if len(self.cache) > self.max_cached:
+                self.cache.popitem(last=False)
+
+        return show_tooltip
+
+    def show_tooltip_ax(self, event, key=None, image=None):
         is_left = event.x < self.fig.bbox.width / 2
         is_bottom = event.y < self.fig.bbox.height / 2
 
+        # Whole pixels, so a cached image looks the same wherever it's shown
         bb_px = Bbox.from_bounds(
-            x0=event.x + (15 if is_left else -self.width - 15),
-            y0=event.y + (15 if is_bottom else -self.height - 15),
+            x0=round(event.x) + (15 if is_left else -self.width - 15),
+            y0=round(event.y) + (15 if is_bottom else -self.height - 15),
             width=self.width,
             height=self.height,
         )
@@ -84,15 +134,62 @@ class add_axes_tooltip(mpl_utils.EventsMixin):
             position=bb_px.transformed(self.fig.transFigure.inverted()),
             visible=True,
         )
-        self.fig.canvas.draw_idle()
+
+        if image is None and key != self.rendered_key:
+            self.render_tooltip_ax(event, key)  # Cached, but not as an image
+
+        if not self.blitter:
+            self.fig.canvas.draw_idle()
+            return
+
+        canvas = self.fig.canvas
+        with mpl_utils.profile(self.fig, "blit"):
+            canvas.restore_region(self.blitter.background)
+
+            # Agg regions are positioned from the top left, so images are
+            # stored with their offset from the top left of the tooltip axes
+            x0, _, _, y1 = self.tooltip_ax.bbox.extents
+            left, top = x0, self.fig.bbox.height - y1
+
+            if image is None:
+                self.fig.draw_artist(self.tooltip_ax)
+                # Anything drawn outside the axes (e.g. a title) would be
+                # cached with whatever was behind it, so isn't cached
+                bbox = self.tooltip_ax.bbox
+                tight_bbox = self.tooltip_ax.get_tightbbox().padded(-1)  # Spines
+                if (
+                    key is not None
+                    and (tight_bbox.min >= bbox.min).all()
+                    and (tight_bbox.max <= bbox.max).all()
+                ):
+                    region = canvas.copy_from_bbox(bbox)
+                    region_left, region_top, _, _ = region.get_extents()
+                    image = (region, region_left - left, region_top - top)
+                    self.cache[key] = (True, image)
+            else:
+                region, dx, dy = image
+                canvas.restore_region(region, xy=(left + dx, top + dy))
+
+            canvas.blit()
+
+    def clear_images(self, _=None):
+        for key, (show_tooltip, _) in self.cache.items():
+            self.cache[key] = (show_tooltip, None)
 
     def on_leave(self, event):
         self.hide_tooltip_ax()
 
     def hide_tooltip_ax(self):
+        if not self.tooltip_ax.get_visible():
+            return
+
         self.tooltip_ax.set_visible(False)
 
-        self.fig.canvas.draw_idle()
+        if self.blitter:
+            self.fig.canvas.restore_region(self.blitter.background)
+            self.fig.canvas.blit()
+        else:
+            self.fig.canvas.draw_idle()
 
 
 if __name__ == "__main__":
@@ -141,4 +238,8 @@ if __name__ == "__main__":
     add_axes_tooltip(
         ax=paginator.axs[0],
         render=render_tooltip_ax,
+        get_key=lambda ax, event: (
+            ax.format_xdata(event.xdata),
+            ax.format_ydata(event.ydata),
+        ),
     )
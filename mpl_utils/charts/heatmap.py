@@ -1,12 +1,55 @@
 from matplotlib import pyplot as plt
 from matplotlib.axes import Axes
 from matplotlib.backend_bases import MouseEvent
-from matplotlib.category import StrCategoryConverter
+import numpy as np
 import pandas as pd
 
 import mpl_utils
 
 
+def get_bin(edges: np.ndarray, value):
+    """
+    Return the index of the bin that `value` falls in, for ascending or
+    descending bin edges, or None if it's outside them all.
+    """
+    if value is None:
+        return None
+
+    n_bins = len(edges) - 1
+    if edges[0] <= edges[-1]:
+        i = np.searchsorted(edges, value, side="right") - 1
+    else:
+        i = n_bins - np.searchsorted(edges[::-1], value, side="left")
+
+    return int(i) if 0 <= i < n_bins else None
+
+
+def get_uniform_edges(centers) -> np.ndarray:
+    """
+    Return the cell edges for evenly spaced cell centers, or None if they
+    aren't evenly spaced.
+    """
+    try:
+        centers = np.asarray(centers, dtype=float)
+    except (TypeError, ValueError):
+        return None
+
+    step = 1.0
+    if len(centers) > 1:
+        steps = np.diff(centers)
+        step = steps[0]
+        if step == 0 or not np.allclose(steps, step, rtol=1e-6, atol=0):
+            return None
+
+    return np.linspace(
+        centers[0] - step / 2, centers[-1] + step / 2, num=len(centers) + 1
+    )
+
+
+# Keyword arguments that mean the same to imshow as to pcolormesh
+IMAGE_KWARGS = {"vmin", "vmax", "norm", "alpha", "zorder", "rasterized", "label"}
+
+
 def plot_heatmap(
     df: pd.DataFrame,
     ax=None,
@@ -14,8 +57,16 @@ def plot_heatmap(
     cmap="Blues_r",
     cbar=True,
     tooltips=True,
+    image: bool = None,
     **kwargs,
 ) -> Axes:
+    """
+    With `image` (the default when the columns and index are categorical or
+    evenly spaced, and `kwargs` allow it), the cells are drawn as one image,
+    rather than a mesh of quads, which is much faster for large matrices.
+    When there are more cells than pixels, the image is downsampled when
+    drawn, with cells averaged. Pass `interpolation="nearest"` to disable that.
+    """
     if ax is None:
         mpl_utils.setup()
         ax = plt.subplots(num=title, clear=True)[1]
@@ -23,13 +74,47 @@ def plot_heatmap(
 
     ax.grid(False)
 
-    quad_mesh = ax.pcolormesh(
-        df.columns,
-        df.index,
-        df,
-        cmap=cmap,
-        **kwargs,
-    )
+    x_edges = y_edges = None
+    if image is None:
+        image = set(kwargs) <= IMAGE_KWARGS | {"interpolation", "interpolation_stage"}
+
+    if image:
+        # Like pcolormesh, set up category or date units first
+        ax.xaxis.update_units(df.columns)
+        ax.yaxis.update_units(df.index)
+        x_edges = get_uniform_edges(ax.xaxis.convert_units(df.columns))
+        y_edges = get_uniform_edges(ax.yaxis.convert_units(df.index))
+
+    if x_edges is not None and y_edges is not None:
+        # Row 0 goes at y_edges[0], as with pcolormesh, and the y limits
+        # stay ascending until inverted below. Likewise for columns, which are
+        # flipped so the x limits stay ascending too.
+        values = df.to_numpy(dtype=float)
+        if x_edges[0] > x_edges[-1]:
+            values = values[:, ::-1]
+        is_ascending = y_edges[0] <= y_edges[-1]
+        mappable = ax.imshow(
+            values,
+            extent=(
+                *sorted([x_edges[0], x_edges[-1]]),
+                *sorted([y_edges[0], y_edges[-1]]),
+            ),
+            origin="lower" if is_ascending else "upper",
+            aspect="auto",
+            cmap=cmap,
+            **kwargs,
+        )
+    else:
+        mappable = ax.pcolormesh(
+            df.columns,
+            df.index,
+            df,
+            cmap=cmap,
+            **kwargs,
+        )
+        coordinates = mappable.get_coordinates()
+        x_edges = coordinates[0, :, 0]
+        y_edges = coordinates[:, 0, 1]
 
     plt.setp(ax.get_xticklabels(), rotation=45, ha="right")
     ax.invert_yaxis()
@@ -39,34 +124,34 @@ def plot_heatmap(
         # So that ax.clear() removes it
         # Note we lose the ability to pan the colorbar
         cb = ax.figure.colorbar(
-            quad_mesh,
+            mappable,
             cax=ax.inset_axes((1.05, 0, 0.05, 1)),
         )
         cb.outline.set_visible(False)
 
     if tooltips:
+        # With cell edges in data coordinates, finding the hovered cell is a
+        # couple of binary searches, rather than a hit test and label lookups
+        values = df.to_numpy()
+
+        def get_cell(event: MouseEvent):
+            row = get_bin(y_edges, event.ydata)
+            col = get_bin(x_edges, event.xdata)
+            if row is None or col is None:
+                return None
+            return row, col
 
         def get_text(event: MouseEvent):
-            if not quad_mesh.contains(event)[0]:
+            if (cell := get_cell(event)) is None:
                 return
 
-            if isinstance(ax.xaxis.converter, StrCategoryConverter):
-                x_value = ax.format_xdata(event.xdata)
-            else:
-                x_value = mpl_utils.get_closest(df.columns, event.xdata)
-
-            if isinstance(ax.yaxis.converter, StrCategoryConverter):
-                y_value = ax.format_ydata(event.ydata)
-            else:
-                y_value = mpl_utils.get_closest(df.index, event.ydata)
-
-            value = df.loc[y_value, x_value]
-
-            return f"{x_value}\n{y_value}\n{value:g}"
+            row, col = cell
+            return f"{df.columns[col]}\n{df.index[row]}\n{values[row, col]:g}"
 
         mpl_utils.add_custom_tooltip(
             ax=ax,
             get_text=get_text,
+            get_key=get_cell,
         )
 
     return ax
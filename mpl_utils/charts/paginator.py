@@ -1,3 +1,4 @@
+from collections import OrderedDict
 from collections.abc import Iterable, Callable
 from itertools import zip_longest
 from typing import Any
@@ -26,13 +27,41 @@ class plot_paginated:
         items: Iterable[Any],
         render: Callable[[Axes, Any], None],
         filter_predicate: Callable[[Any, str], bool] = None,
+        search_key: Callable[[Any], str] = None,
         items_per_page=5,
         title="Paginator",
+        max_cached_pages=0,
+        prerender=True,
     ):
-        self.items = items
+        """
+        By default, every page is rendered into the same axes. With
+        `max_cached_pages`, rendered pages are kept (as hidden axes), so
+        flipping back to a page doesn't call `render` again. The cap is a page
+        count, not a memory budget, so lower it for pages with a lot of data.
+        Each cached page has its own axes, so `self.axs` changes on page
+        flips, and helpers attached to the axes (e.g. tooltips or legends)
+        only apply to the page they were added to.
+
+        When caching, if `prerender` is True, the next and previous pages are
+        rendered while idle after each page change (one per timer tick, so
+        input isn't blocked for long), making flipping to them instant too.
+
+        Instead of a `filter_predicate`, a `search_key` can be given, returning
+        the text to search for each item. The keys are indexed once (see
+        `mpl_utils.SearchIndex`), so searching stays fast for many items.
+        """
+        # A list, so items (and their cache keys) are the same after a search
+        self.items = list(items)
         self.render = render
         self.filter_predicate = filter_predicate
+        self.search_index = None
+        if search_key:
+            self.search_index = mpl_utils.SearchIndex(map(search_key, self.items))
         self.items_per_page = items_per_page
+        self.max_cached_pages = max_cached_pages
+        self.prerender = prerender
+        self.prerender_timer = None
+        self.prerender_queue = []
 
         self.fig, axs = mpl_utils.flex_subplots(
             title,
@@ -41,8 +70,11 @@ class plot_paginated:
 
         axs[-1].set_axis_off()
         self.axs = axs[:-1]
+        self.subplot_specs = [ax.get_subplotspec() for ax in self.axs]
+        self.page_axs = OrderedDict()  # {page key: axes}, least recent first
 
-        self.paged_items = batched(items, items_per_page)
+        self.filtered_items = self.items
+        self.paged_items = batched(self.items, items_per_page)
         self.curr_page_index = 0
         self.curr_page_items = self.paged_items[self.curr_page_index]
 
@@ -71,25 +103,37 @@ class plot_paginated:
         )
         self.next_button.on_clicked(lambda event: self.change_page(1))
 
-        if filter_predicate:
+        if filter_predicate or search_key:
             self.search_box = mpl_utils.add_text_box(
                 origin="bottom right",
                 bounds=(10, 10, 200, 30),
                 label="Search: ",
                 on_change=self.on_search_change,
+                debounce_ms=50,
+                work=self.filter_items,
             )
 
         self.render_page()
 
         self.fig._plot_paginated_ref = self
 
-    def on_search_change(self, text):
+    def filter_items(self, text: str) -> list:
+        # On a worker thread, see add_text_box
         if text == "":
-            filtered_items = self.items
-        else:
-            filtered_items = [
-                item for item in self.items if self.filter_predicate(item, text)
-            ]
+            return self.items
+
+        if self.search_index:
+            return [self.items[i] for i in self.search_index.search(text)]
+
+        return [item for item in self.items if self.filter_predicate(item, text)]
+
+    def on_search_change(self, text: str, filtered_items: list = None):
+        if filtered_items is None:
+            filtered_items = self.filter_items(text)
+
+        if list(map(id, filtered_items)) == list(map(id, self.filtered_items)):
+            return  # Same matches as the last search
+        self.filtered_items = filtered_items
 
         self.paged_items = batched(filtered_items, self.items_per_page)
         self.curr_page_index = 0
@@ -109,21 +153,102 @@ class plot_paginated:
 
         self.render_page()
 
-    def render_page(self):
-        for item, ax in zip_longest(self.curr_page_items, self.axs):
-            ax.clear()
+    def get_page_axes(self, page_items: list) -> list[Axes]:
+        """
+        Return the axes for a page of items, rendering them if not cached.
+        """
+        if self.max_cached_pages == 0:
+            # Re-render into the same axes each time
+            for ax in self.axs:
+                ax.clear()
+            self.render_items(page_items, self.axs)
+            return self.axs
+
+        key = tuple(id(item) for item in page_items)
+        if key in self.page_axs:
+            self.page_axs.move_to_end(key)
+            return self.page_axs[key]
+
+        with mpl_utils.profile(self.fig, "paginator.render"):
+            if self.page_axs:
+                axs = [self.fig.add_subplot(spec) for spec in self.subplot_specs]
+                set_axes_shown(axs, False)
+            else:
+                axs = self.axs  # The first page uses the original axes
+
+            self.render_items(page_items, axs)
+
+        self.page_axs[key] = axs
 
+        # Forget the least recently used pages, except this one and the current one
+        for old_key in list(self.page_axs):
+            if len(self.page_axs) <= self.max_cached_pages:
+                break
+            if old_key == key or self.page_axs[old_key] is self.axs:
+                continue
+            for ax in self.page_axs.pop(old_key):
+                ax.remove()
+
+        return axs
+
+    def render_items(self, page_items: list, axs: list[Axes]):
+        for item, ax in zip_longest(page_items, axs):
             if item is None:
                 ax.set_axis_off()
                 continue
 
             self.render(ax, item)
 
+    def render_page(self):
+        axs = self.get_page_axes(self.curr_page_items)
+        if axs is not self.axs:
+            set_axes_shown(self.axs, False)
+            set_axes_shown(axs, True)
+            self.axs = axs
+
         self.page_text.set_text(
             f"{self.curr_page_index + 1} of {len(self.paged_items)}"
         )
         self.fig.canvas.draw_idle()
 
+        if self.prerender and self.max_cached_pages and len(self.paged_items) > 1:
+            page_count = len(self.paged_items)
+            self.prerender_queue = [
+                self.paged_items[(self.curr_page_index + shift) % page_count]
+                for shift in (1, -1)
+            ]
+            self.schedule_prerender()
+
+    def schedule_prerender(self):
+        if self.prerender_timer:
+            self.prerender_timer.stop()
+
+        # Runs once the event loop is idle, after this page is drawn
+        self.prerender_timer = self.fig.canvas.new_timer(50)  # ms
+        self.prerender_timer.single_shot = True
+        self.prerender_timer.add_callback(self.prerender_next_page)
+        self.prerender_timer.start()
+
+    def prerender_next_page(self):
+        # One page per tick, so events in between are handled
+        self.prerender_timer = None
+        while self.prerender_queue:
+            page_items = self.prerender_queue.pop(0)
+            key = tuple(id(item) for item in page_items)
+            if key not in self.page_axs:
+                self.get_page_axes(page_items)
+                break
+
+        if self.prerender_queue:
+            self.schedule_prerender()
+
+
+def set_axes_shown(axs: list[Axes], shown: bool):
+    # Hidden axes take no space in the layout and get no events
+    for ax in axs:
+        ax.set_visible(shown)
+        ax.set_in_layout(shown)
+
 
 if __name__ == "__main__":
     df = pd.read_csv("../../data/crop-data.csv")
@@ -147,6 +272,6 @@ if __name__ == "__main__":
     self = plot_paginated(
         items=df.groupby("Country"),
         render=render,
-        filter_predicate=lambda item, text: text.lower() in item[0].lower(),
+        search_key=lambda item: item[0],
     )
     self.fig.suptitle("Yield by country and crop")
@@ -1,6 +1,8 @@
 from collections.abc import Sequence, Iterable
 
+import matplotlib as mpl
 from matplotlib.axes import Axes
+from matplotlib.collections import PathCollection
 import numpy as np
 import pandas as pd
 from matplotlib import pyplot as plt
@@ -8,6 +10,26 @@ from matplotlib import pyplot as plt
 import mpl_utils
 
 
+# `Collection.set_linewidth` was checked against these versions, see below.
+# Later ones use it as is until checked again.
+_SET_LINEWIDTH_CHECKED = mpl.__version_info__[:2] <= (3, 11)
+
+
+def set_edge_widths(collection: PathCollection, linewidths: np.ndarray):
+    # The caller changes its array in place, so the collection gets a copy
+    linewidths = linewidths.copy()
+
+    # `set_linewidth` scales every point's dash pattern in a Python loop, which
+    # takes seconds for a million points. Solid edges have nothing to scale,
+    # and otherwise it only sets these private attributes.
+    if _SET_LINEWIDTH_CHECKED and collection.get_linestyle() == [(0, None)]:
+        collection._us_lw = linewidths
+        collection._linewidths = linewidths
+        collection.stale = True
+    else:
+        collection.set_linewidth(linewidths)
+
+
 def plot_searchable_scatter(
     x,
     y,
@@ -29,15 +51,26 @@ def plot_searchable_scatter(
         get_text=lambda sel: labels[sel.index],
     )
 
-    def on_text_change(text):
-        if text == "":
-            path_collection.set(linewidth=0)
-        else:
-            matches = [text.lower() in label.lower() for label in labels]
-            path_collection.set(
-                edgecolor=plt.rcParams["text.color"],
-                linewidth=np.where(matches, 2, 0),
-            )
+    # Labels are lowercased once, and only points that change get new widths
+    search_index = mpl_utils.SearchIndex(labels, trigrams=False)
+    matches = np.zeros(len(labels), dtype=bool)
+    linewidths = np.zeros(len(labels))
+
+    def search(text):  # On a worker thread, see add_text_box
+        new_matches = np.zeros(len(labels), dtype=bool)
+        if text != "":
+            new_matches[search_index.search(text)] = True
+        return new_matches
+
+    def on_text_change(text, new_matches):
+        changed = np.flatnonzero(new_matches != matches)
+        if len(changed) == 0:
+            return
+
+        matches[changed] = new_matches[changed]
+        linewidths[changed] = np.where(new_matches[changed], 2, 0)
+        path_collection.set_edgecolor(plt.rcParams["text.color"])
+        set_edge_widths(path_collection, linewidths)
         fig.canvas.draw_idle()
 
     mpl_utils.add_text_box(
@@ -45,6 +78,8 @@ def plot_searchable_scatter(
         origin="top right",
         label="Search: ",
         on_change=on_text_change,
+        debounce_ms=50,
+        work=search,
     )
 
     return ax
@@ -1,4 +1,4 @@
-from collections.abc import Callable
+from collections.abc import Callable, Hashable, Sequence
 from typing import Optional
 
 from matplotlib import pyplot as plt
@@ -6,32 +6,52 @@ from matplotlib.artist import Artist
 from matplotlib.axes import Axes
 from matplotlib.backend_bases import MouseEvent
 from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
 from matplotlib.patheffects import withSimplePatchShadow
 from matplotlib.text import Text
 from matplotlib.transforms import IdentityTransform
 import pandas as pd
 
 import mpl_utils
+from mpl_utils.profiling import count
 
 
 # Added in #603
 class Blitter:
-    def __init__(self, fig: Figure = None):
+    def __init__(self, fig: Figure = None, artists: Sequence[Artist] = ()):
+        """
+        `artists` are always shown, so are drawn on top of the background
+        after every full draw, and with every blit.
+        """
         fig = fig or plt.gcf()
         self.fig = fig
         self.canvas = fig.canvas
         self.background = None
+        self.artists = list(artists)
+        for artist in self.artists:
+            artist.set_animated(True)
         self.capture_background()
 
-        fig.canvas.mpl_connect("draw_event", self.capture_background)
+        mpl_utils.get_event_dispatcher(fig).subscribe(
+            "draw_event", self.capture_background
+        )
 
     def capture_background(self, _=None):
         self.background = self.canvas.copy_from_bbox(self.fig.bbox)
 
-    def blit(self, artist: Artist):
-        self.canvas.restore_region(self.background)
-        self.fig.draw_artist(artist)
-        self.canvas.blit()
+        # Animated artists are skipped by a full draw, so add them back
+        for artist in self.artists:
+            self.fig.draw_artist(artist)
+
+    def blit(self, *artists: Artist):
+        with mpl_utils.profile(self.fig, "blit"):
+            self.canvas.restore_region(self.background)
+            for artist in [*self.artists, *artists]:
+                self.fig.draw_artist(artist)
+            self.canvas.blit()
+
+        if profiler := mpl_utils.get_profiler(self.fig):
+            profiler.add_frame()
 
 
 def _default_get_text(event: MouseEvent):
@@ -45,12 +65,22 @@ class add_custom_tooltip(mpl_utils.EventsMixin):
         ax: Axes = None,
         get_text: Callable[[MouseEvent], Optional[str]] = _default_get_text,
         use_blit=True,
+        max_fps: float = None,
+        get_key: Callable[[MouseEvent], Hashable] = None,
     ):
+        """
+        If `get_key` is given, it should return a value describing what the
+        tooltip would show for an event (e.g. a heatmap cell), or None.
+        On mouse moves with the same key as the last, `get_text` isn't called,
+        and the tooltip is only moved to follow the cursor.
+        """
         ax = ax or plt.gca()
-        super().__init__(ax)
+        super().__init__(ax, max_fps=max_fps)
         self.ax = ax
         self.fig = ax.figure
         self.get_text = get_text
+        self.get_key = get_key
+        self.last_key = None
 
         if use_blit and self.fig.canvas.supports_blit:
             self.blitter = Blitter(self.fig)
@@ -72,35 +102,49 @@ class add_custom_tooltip(mpl_utils.EventsMixin):
             animated=use_blit,
         )
 
-        self.fig.canvas.mpl_connect("motion_notify_event", self.on_mouse_move)
+        self.connect_motion(self.on_mouse_move)
         ax._custom_tooltip_ref = self
 
     def on_mouse_move(self, event: MouseEvent):
         if event.button:
+            self.last_key = None
             self.hide_tooltip()
             return
         if event.inaxes != self.ax:
             return
 
+        key = self.get_key(event) if self.get_key else None
+        if key is not None and key == self.last_key:
+            # Same contents, so only the position changes
+            count(self.fig, "tooltip.moved")
+            if self.tooltip.get_visible():
+                self.move_tooltip(event)
+                self.render()
+            return
+        self.last_key = key
+
         text = self.get_text(event)
 
         if text:
-            is_left = event.x < self.fig.bbox.width / 2
-            is_bottom = event.y < self.fig.bbox.height / 2
-
-            self.tooltip.set(
-                text=text,
-                x=event.x + (15 if is_left else -15),
-                y=event.y + (15 if is_bottom else -15),
-                ha="left" if is_left else "right",
-                va="bottom" if is_bottom else "top",
-                visible=True,
-            )
+            self.tooltip.set(text=text, visible=True)
+            self.move_tooltip(event)
             self.render()
         else:
             self.hide_tooltip()
 
+    def move_tooltip(self, event: MouseEvent):
+        is_left = event.x < self.fig.bbox.width / 2
+        is_bottom = event.y < self.fig.bbox.height / 2
+
+        self.tooltip.set(
+            x=event.x + (15 if is_left else -15),
+            y=event.y + (15 if is_bottom else -15),
+            ha="left" if is_left else "right",
+            va="bottom" if is_bottom else "top",
+        )
+
     def on_leave(self, _):
+        self.last_key = None
         if self.tooltip.get_visible():
             self.hide_tooltip()
 
@@ -119,15 +163,16 @@ if __name__ == "__main__":
 
     def get_text(event: MouseEvent):
         year = mpl_utils.get_closest_x(event)
+        y_values = mpl_utils.get_y_values_at_x(event.inaxes, year)
 
         has_match = False
         text = mpl_utils.bold(f"{year:g}")
 
-        for line in event.inaxes.lines:
-            if line.contains(event)[0]:
+        for line in mpl_utils.get_artists_at_event(event):
+            if isinstance(line, Line2D):
                 has_match = True
                 country = line.get_label()
-                value = mpl_utils.get_y_at_x(line, year)
+                value = y_values[line]
                 text += f"\n{country}: {value:.2f}"
 
         if has_match:
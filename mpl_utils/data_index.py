@@ -0,0 +1,186 @@
+from matplotlib.axes import Axes
+from matplotlib.collections import PathCollection
+from matplotlib.lines import Line2D
+import numpy as np
+
+import mpl_utils
+from mpl_utils.decimation import DecimatedLine
+
+
+def _is_in_data_coords(ax: Axes, artist):
+    if isinstance(artist, PathCollection):
+        return artist.get_offset_transform() == ax.transData
+    return artist.get_transform() == ax.transData
+
+
+def get_data_artists(ax: Axes):
+    # Lines in axes coordinates, like axvline (e.g. add_dynamic_legend's
+    # cursor line), aren't data. Leaving them out also keeps their
+    # set_xdata() on every hover step from invalidating the index.
+    return [
+        artist
+        for artist in ax.get_children()
+        if isinstance(artist, (Line2D, PathCollection))
+        and _is_in_data_coords(ax, artist)
+    ]
+
+
+def _get_data_key(artist):
+    # These return the artist's cached data arrays, which are replaced (not
+    # mutated) whenever the data changes, so identity tells us about changes.
+    if isinstance(artist, DecimatedLine):
+        return artist.get_full_xydata()
+    if isinstance(artist, Line2D):
+        return artist.get_xydata()
+    return artist.get_offsets()
+
+
+class DataIndex:
+    """
+    A cache of the data in all Line2D and PathCollection artists of an axes.
+
+    The cache is only rebuilt when artists are added or removed, or when their
+    data is replaced (e.g. with `set_data()` or `set_offsets()`). Data that
+    is mutated in place is not detected, call `invalidate()` after doing that.
+
+    Attributes
+    ----------
+    artists : list
+        The Line2D and PathCollection artists in the axes.
+    x_values : np.ndarray
+        The sorted, unique, non-NaN x values of all artists.
+    x_counts : np.ndarray
+        The number of points (across all artists) at each x value.
+    columns : dict
+        Maps each artist to its column in `y_values`.
+    y_values : np.ndarray
+        A (len(x_values), len(artists)) array of the y value of each artist at
+        each x value, NaN where an artist has no point. Built on first use.
+    """
+
+    def __init__(self, ax: Axes):
+        self.ax = ax
+        self.artists = []
+        self.x_values = np.empty(0)
+        self.x_counts = np.empty(0, dtype=int)
+        self.columns = {}
+        self._y_values = None
+        self._keys = None
+
+        ax._data_index_ref = self
+
+    def invalidate(self):
+        self._keys = None
+
+    def refresh(self):
+        artists = get_data_artists(self.ax)
+        keys = [_get_data_key(artist) for artist in artists]
+
+        if (
+            self._keys is not None
+            and len(keys) == len(self._keys)
+            and all(a is b for a, b in zip(artists, self.artists))
+            and all(a is b for a, b in zip(keys, self._keys))
+        ):
+            return self
+
+        self.artists = artists
+        self._keys = keys  # Keeping references also stops ids being reused
+        self.build()
+
+        return self
+
+    def build(self):
+        x_arrays = [np.asarray(key[:, 0], dtype=float) for key in self._keys]
+        self.columns = {artist: i for i, artist in enumerate(self.artists)}
+        self._y_values = None
+
+        if x_arrays:
+            x_values, x_counts = np.unique(
+                np.concatenate(x_arrays), return_counts=True
+            )
+            not_nan = ~np.isnan(x_values)
+            self.x_values = x_values[not_nan]
+            self.x_counts = x_counts[not_nan]
+        else:
+            self.x_values = np.empty(0)
+            self.x_counts = np.empty(0, dtype=int)
+
+    def update_artist(self, artist, x_added, x_removed):
+        """
+        Update the index for an artist whose new data is its old data with the
+        points at `x_added` added and those at `x_removed` removed (e.g. a
+        streaming line), without rebuilding it from every artist's data.
+
+        If the index isn't up to date, it's left to rebuild on next use.
+        """
+        col = self.columns.get(artist)
+        if self._keys is None or col is None:
+            self.invalidate()
+            return
+
+        self._keys[col] = _get_data_key(artist)
+        self._y_values = None
+
+        x_added = np.asarray(x_added, dtype=float)
+        x_added = x_added[~np.isnan(x_added)]
+        if len(x_added):
+            values, counts = np.unique(x_added, return_counts=True)
+            rows = np.searchsorted(self.x_values, values)
+            known = rows < len(self.x_values)
+            known[known] = self.x_values[rows[known]] == values[known]
+            self.x_counts[rows[known]] += counts[known]
+
+            # Usually, new values are all after the existing ones
+            self.x_values = np.insert(self.x_values, rows[~known], values[~known])
+            self.x_counts = np.insert(self.x_counts, rows[~known], counts[~known])
+
+        x_removed = np.asarray(x_removed, dtype=float)
+        x_removed = x_removed[~np.isnan(x_removed)]
+        if len(x_removed):
+            rows = np.searchsorted(self.x_values, x_removed)
+            np.subtract.at(self.x_counts, rows, 1)
+            kept = self.x_counts > 0
+            self.x_values = self.x_values[kept]
+            self.x_counts = self.x_counts[kept]
+
+    @property
+    def y_values(self):
+        if self._y_values is None:
+            y_values = np.full((len(self.x_values), len(self.artists)), np.nan)
+
+            for col, key in enumerate(self._keys):
+                x_data = np.asarray(key[:, 0], dtype=float)
+                y_data = np.asarray(key[:, 1], dtype=float)
+
+                # Like list.index(), use the first point at each x value
+                x_data, first_indexes = np.unique(x_data, return_index=True)
+                not_nan = ~np.isnan(x_data)
+                rows = np.searchsorted(self.x_values, x_data[not_nan])
+                y_values[rows, col] = y_data[first_indexes[not_nan]]
+
+            self._y_values = y_values
+
+        return self._y_values
+
+    def get_y_values(self, x):
+        """
+        Return the y value of every artist at x (in data units) as an array
+        aligned with `artists`. All values are NaN if x isn't a known x value.
+        """
+        row = np.searchsorted(self.x_values, x)
+        if row < len(self.x_values) and self.x_values[row] == x:
+            return self.y_values[row]
+
+        return np.full(len(self.artists), np.nan)
+
+    def get_closest_x(self, target):
+        return mpl_utils.get_closest(self.x_values, target, assume_sorted=True)
+
+
+def get_data_index(ax: Axes) -> DataIndex:
+    """
+    Return the up-to-date DataIndex for an axes, creating it if required.
+    """
+    index = getattr(ax, "_data_index_ref", None) or DataIndex(ax)
+    return index.refresh()
@@ -0,0 +1,235 @@
+from matplotlib.axes import Axes
+from matplotlib.lines import Line2D
+from matplotlib.path import Path
+import numpy as np
+
+
+def decimate(x, y, x_min, x_max, n_cols):
+    """
+    Reduce sorted x/y data to the points needed to draw the range
+    [x_min, x_max] across `n_cols` pixel columns: the first, last, min and
+    max point in each column. Gaps (runs of NaN y values) are kept as a
+    single NaN point, so the line still breaks there.
+    """
+    # Include a point either side so lines run off the edge of the view
+    i0, i1 = np.searchsorted(x, [x_min, x_max])
+    x = x[max(i0 - 1, 0) : i1 + 1]
+    y = y[max(i0 - 1, 0) : i1 + 1]
+
+    finite_x = np.isfinite(x)
+    if not finite_x.all():
+        x, y = x[finite_x], y[finite_x]
+
+    if len(x) <= 4 * n_cols:
+        return x, y
+
+    gaps = np.isnan(y)
+    gap_starts = np.flatnonzero(gaps & ~np.append(False, gaps[:-1]))
+    valid_indexes = np.flatnonzero(~gaps)
+    if not len(valid_indexes):
+        return x[gap_starts], y[gap_starts]
+
+    # Columns are split at gaps, so points either side aren't joined
+    run_ids = np.cumsum(gaps)[valid_indexes]
+    valid_y = y[valid_indexes]
+
+    # Points just outside the view get their own columns (-1 and n_cols)
+    span = (x_max - x_min) or 1
+    cols = np.floor(
+        np.clip((x[valid_indexes] - x_min) / span * n_cols, -1, n_cols)
+    ).astype(int)
+    starts = np.flatnonzero(
+        np.diff(cols, prepend=cols[0] - 1) | np.diff(run_ids, prepend=-1)
+    )
+    ends = np.append(starts[1:], len(valid_y))
+    col_of_point = np.repeat(np.arange(len(starts)), ends - starts)
+
+    def first_index_of(values):
+        # The index of the first point in each column equal to that column's value
+        indexes = np.flatnonzero(valid_y == values[col_of_point])
+        _, firsts = np.unique(col_of_point[indexes], return_index=True)
+        return indexes[firsts]
+
+    min_indexes = first_index_of(np.minimum.reduceat(valid_y, starts))
+    max_indexes = first_index_of(np.maximum.reduceat(valid_y, starts))
+
+    indexes = np.concatenate([starts, min_indexes, max_indexes, ends - 1])
+    indexes = np.unique(np.concatenate([valid_indexes[indexes], gap_starts]))
+    return x[indexes], y[indexes]
+
+
+def build_pyramid(x, y, min_points=1000) -> list[tuple[np.ndarray, np.ndarray]]:
+    """
+    Return successive 2x reductions of sorted x/y data, finest (the valid data
+    itself) first, until a level has fewer than `min_points` points.
+
+    Each level keeps the min and max point of every four points in the level
+    below, plus the first and last points, so every level has the same x and
+    y extent as the full data. A block with a gap (NaN y values) also keeps
+    a NaN point, so gaps stay visible at every level.
+    """
+    finite_x = np.isfinite(x)
+    levels = [(x, y) if finite_x.all() else (x[finite_x], y[finite_x])]
+
+    while len(levels[-1][0]) >= max(min_points, 8):
+        x, y = levels[-1]
+
+        # Pad with the last point to whole blocks of four
+        pad = -len(x) % 4
+        blocks_x = np.append(x, np.repeat(x[-1], pad)).reshape(-1, 4)
+        blocks_y = np.append(y, np.repeat(y[-1], pad)).reshape(-1, 4)
+
+        # The min and max of each block, and the first NaN if it has a gap, in
+        # x order. Blocks without a gap repeat their max, which is dropped.
+        nan = np.isnan(blocks_y)
+        max_indexes = np.where(nan, -np.inf, blocks_y).argmax(axis=1)
+        points = np.sort(
+            np.column_stack(
+                [
+                    np.where(nan, np.inf, blocks_y).argmin(axis=1),
+                    max_indexes,
+                    np.where(nan.any(axis=1), nan.argmax(axis=1), max_indexes),
+                ]
+            ),
+            axis=1,
+        )
+        rows = np.arange(len(blocks_x))[:, None]
+        kept = np.diff(points, axis=1, prepend=-1) != 0
+
+        levels.append(
+            (
+                np.concatenate([x[:1], blocks_x[rows, points][kept], x[-1:]]),
+                np.concatenate([y[:1], blocks_y[rows, points][kept], y[-1:]]),
+            )
+        )
+
+    return levels
+
+
+def get_pyramid_level(levels, x_min, x_max, n_cols):
+    """
+    Return the points of the coarsest pyramid level that still has about two
+    points per pixel column in [x_min, x_max], with a point either side.
+    """
+    for x, y in reversed(levels):
+        i0, i1 = np.searchsorted(x, [x_min, x_max])
+        if i1 - i0 >= 4 * n_cols or x is levels[0][0]:
+            return x[max(i0 - 1, 0) : i1 + 1], y[max(i0 - 1, 0) : i1 + 1]
+
+
+class DecimatedLine(Line2D):
+    """
+    A Line2D that only draws as many points as there are pixels. The
+    full-resolution data is kept, and reduced to the min and max in each pixel
+    column of the current view whenever the view or axes width changes.
+
+    While `draft` is True (e.g. mid scroll zoom, see `add_zoom_on_scroll`),
+    the line instead draws a level from a precomputed pyramid of 2x
+    reductions, which costs the same however many points are in view.
+
+    `get_data()` and friends return the drawn (decimated) data. The mpl_utils
+    hover helpers use `get_full_data()`, so they see every point. `get_path()`,
+    which `ax.relim()` measures, returns the coarsest pyramid level, so the
+    data limits cover the full data rather than the last view drawn.
+
+    x values must be sorted. Gaps (NaN y values) are kept, as in a Line2D.
+    """
+
+    def __init__(self, x, y, **kwargs):
+        super().__init__([], [], **kwargs)
+        self.draft = False
+        self._view_key = None
+        self.set_full_data(x, y)
+
+    def set_full_data(self, x, y):
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        if np.any(np.diff(x) < 0):
+            raise ValueError("DecimatedLine x values must be sorted")
+
+        self._full_xy = np.column_stack([x, y])
+        self.pyramid = build_pyramid(x, y)
+        self._extent_path = Path(np.column_stack(self.pyramid[-1]))
+        self._view_key = None
+
+        # Until drawn, show the coarsest level. It has the same extent as the
+        # full data, so the data limits are right without a pass over it all.
+        self.set_data(*self.pyramid[-1])
+
+    def get_full_data(self):
+        return self._full_xy[:, 0], self._full_xy[:, 1]
+
+    def get_full_xydata(self):
+        return self._full_xy
+
+    def get_path(self):
+        # Same extent as the full data, however the line was last decimated
+        return self._extent_path
+
+    def update_decimation(self):
+        ax = self.axes
+        x_min, x_max = ax.get_xbound()
+        n_cols = max(int(ax.bbox.width), 1)
+        view_key = (x_min, x_max, n_cols, ax.get_xscale(), self.draft)
+
+        if view_key == self._view_key:
+            return
+        self._view_key = view_key
+
+        if self.draft:
+            self.set_data(*get_pyramid_level(self.pyramid, x_min, x_max, n_cols))
+            return
+
+        x, y = self.get_full_data()
+        if ax.get_xscale() != "linear":
+            # Columns are spaced evenly in scaled space, so decimate there
+            scale = ax.xaxis.get_transform()
+            x_min, x_max = scale.transform([x_min, x_max])
+            x, y = decimate(scale.transform(x), y, x_min, x_max, n_cols)
+            self.set_data(scale.inverted().transform(x), y)
+        else:
+            self.set_data(*decimate(x, y, x_min, x_max, n_cols))
+
+    def draw(self, renderer):
+        if self.axes:
+            # Changing the data mid-draw shouldn't trigger another draw
+            stale_callback, self.stale_callback = self.stale_callback, None
+            self.update_decimation()
+            self.stale_callback = stale_callback
+        super().draw(renderer)
+
+
+def plot_decimated(ax: Axes, x, y, **kwargs) -> DecimatedLine:
+    """
+    Like `ax.plot(x, y, **kwargs)` for a single series, but draws a DecimatedLine.
+    """
+    (line,) = ax.plot(x, y, **kwargs)
+    return _replace_line(ax, line)
+
+
+def _replace_line(ax: Axes, line: Line2D) -> DecimatedLine:
+    new_line = DecimatedLine(*line.get_data(orig=False))
+    new_line.update_from(line)
+    new_line.set_zorder(line.get_zorder())
+    line.remove()
+    ax.add_line(new_line)
+    return new_line
+
+
+def decimate_lines(ax: Axes, min_points=10_000) -> list[DecimatedLine]:
+    """
+    Replace each Line2D in `ax` with more than `min_points` points (and sorted x
+    values) with an equivalent DecimatedLine. Returns the new lines.
+    """
+    new_lines = []
+    for line in list(ax.get_lines()):
+        if isinstance(line, DecimatedLine):
+            continue
+
+        x, y = line.get_data(orig=False)
+        if len(x) <= min_points or np.any(np.diff(x) < 0):
+            continue
+
+        new_lines.append(_replace_line(ax, line))
+
+    return new_lines
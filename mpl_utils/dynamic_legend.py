@@ -3,6 +3,7 @@ from matplotlib.axes import Axes
 import pandas as pd
 
 import mpl_utils
+from mpl_utils.custom_tooltip import Blitter
 
 
 class add_dynamic_legend(mpl_utils.EventsMixin):
@@ -10,13 +11,15 @@ class add_dynamic_legend(mpl_utils.EventsMixin):
         self,
         ax: Axes = None,
         title_format="{:g}",
+        use_blit=False,
+        max_fps: float = None,
         **kwargs,
     ):
         if kwargs.get("reverse"):
             raise ValueError("Reversed legend is not supported")
 
         ax = ax or plt.gca()
-        super().__init__(ax)
+        super().__init__(ax, max_fps=max_fps)
 
         self.ax = ax
         self.title_format = title_format
@@ -31,11 +34,24 @@ class add_dynamic_legend(mpl_utils.EventsMixin):
             visible=False,
         )
 
+        # Blitting redraws only the legend and line on mouse move, but animated
+        # artists are left out of saved figures, so it's opt-in
+        if use_blit and self.fig.canvas.supports_blit:
+            self.blitter = Blitter(self.fig, artists=[self.legend, self.vline])
+        else:
+            self.blitter = None
+
         self.locked = False
 
-        self.fig.canvas.mpl_connect("motion_notify_event", self.on_mouse_move)
+        self.connect_motion(self.on_mouse_move)
         ax._dynamic_legend_ref = self
 
+    def get_motion_key(self, event):
+        # The legend only changes when the nearest x value does
+        if event.inaxes != self.ax or event.button or self.locked:
+            return None
+        return mpl_utils.get_closest_x(event)
+
     def on_mouse_move(self, event):
         if event.button:  # a drag
             return
@@ -65,15 +81,17 @@ class add_dynamic_legend(mpl_utils.EventsMixin):
         x_value_string = self.title_format.format(x_value)
         self.legend.set_title(f"Legend (values for {x_value_string})")
 
+        y_values = mpl_utils.get_y_values_at_x(self.ax, x_value)
+
         legend_texts = self.legend.texts
         ax_artists, labels = self.ax.get_legend_handles_labels()
         for text, ax_artist, label in zip(legend_texts, ax_artists, labels):
-            value = mpl_utils.get_y_at_x(ax_artist, x_value)
+            value = y_values.get(ax_artist, float("nan"))
             text.set_text(f"{label} ({value:g})")
 
         self.vline.set_xdata([x_value])
         self.vline.set_visible(True)
-        self.fig.canvas.draw_idle()
+        self.render()
 
     def reset(self):
         self.vline.set_visible(False)
@@ -84,7 +102,13 @@ class add_dynamic_legend(mpl_utils.EventsMixin):
         for text, artist, label in zip(legend_texts, artists, labels):
             text.set_text(label)
 
-        self.fig.canvas.draw_idle()
+        self.render()
+
+    def render(self):
+        if self.blitter:
+            self.blitter.blit()
+        else:
+            self.fig.canvas.draw_idle()
 
 
 if __name__ == "__main__":
@@ -99,4 +123,4 @@ if __name__ == "__main__":
         values="Yield",
     )
     ax.plot(chart_df, label=chart_df.columns)
-    add_dynamic_legend(loc="upper left")
+    add_dynamic_legend(loc="upper left", use_blit=True)
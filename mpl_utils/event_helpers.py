@@ -1,20 +1,182 @@
 import math
+import time
 
 from matplotlib.axes import Axes
-from matplotlib.backend_bases import MouseButton, MouseEvent
+from matplotlib.backend_bases import Event, MouseButton, MouseEvent, TimerBase
+from matplotlib.figure import Figure
+
+from .profiling import count, profile
+
+
+def _get_handler_name(handler):
+    if owner := getattr(handler, "__self__", None):
+        return f"{type(owner).__name__}.{handler.__name__}"
+    return getattr(handler, "__qualname__", repr(handler))
+
+
+class EventDispatcher:
+    """
+    Connects to each event type once per figure, and passes events on to
+    subscribers, either for all events or only for events in a given axes.
+    This saves running every helper's handler just so it can check
+    `event.inaxes` and return.
+    """
+
+    def __init__(self, fig: Figure):
+        self.fig = fig
+        self.cids = {}
+        self.subscribers = {}  # {event name: {axes or None: [handlers]}}
+
+        fig._event_dispatcher_ref = self
+
+    def subscribe(self, name: str, handler, ax: Axes = None):
+        """
+        Call `handler` for `name` events, or if `ax` is given, only for
+        `name` events where `event.inaxes` is `ax`.
+        """
+        if name not in self.cids:
+            self.cids[name] = self.fig.canvas.mpl_connect(name, self.dispatch)
+
+        self.subscribers.setdefault(name, {}).setdefault(ax, []).append(handler)
+
+    def dispatch(self, event: Event):
+        handlers_by_ax = self.subscribers.get(event.name, {})
+        handlers = list(handlers_by_ax.get(None, []))
+
+        if (ax := getattr(event, "inaxes", None)) is not None:
+            handlers.extend(handlers_by_ax.get(ax, []))
+
+        profiler = getattr(self.fig, "_profiler_ref", None)
+
+        for handler in handlers:
+            try:
+                if profiler:
+                    with profiler.time(_get_handler_name(handler)):
+                        handler(event)
+                else:
+                    handler(event)
+            except Exception as exc:
+                # Behave like the canvas callback registry, so one broken
+                # handler doesn't stop the others
+                exception_handler = self.fig.canvas.callbacks.exception_handler
+                if exception_handler is None:
+                    raise
+                exception_handler(exc)
+
+    def clear(self):
+        for cid in self.cids.values():
+            self.fig.canvas.mpl_disconnect(cid)
+        self.cids = {}
+        self.subscribers = {}
+
+
+def get_event_dispatcher(fig: Figure) -> EventDispatcher:
+    return getattr(fig, "_event_dispatcher_ref", None) or EventDispatcher(fig)
+
+
+def has_event_loop(canvas) -> bool:
+    """
+    Whether the canvas' timers fire. Without a GUI event loop (e.g. the Agg
+    backend), `new_timer()` returns a plain TimerBase, which never runs.
+    """
+    return type(canvas.new_timer()) is not TimerBase
 
 
 # Added in #509
 class EventsMixin:
-    def __init__(self, ax: Axes):
+    def __init__(self, ax: Axes, max_fps: float = None):
+        """
+        Parameters
+        ----------
+        ax : matplotlib.axes.Axes
+            The axes the events are for.
+        max_fps : float, optional
+            If set, motion events connected with `connect_motion()` are coalesced,
+            so that only the latest is handled, at most `max_fps` times a second.
+        """
         self.ax = ax
-        ax.figure.canvas.mpl_connect("button_press_event", self._on_button_press)
-        ax.figure.canvas.mpl_connect("button_release_event", self._on_button_release)
-        ax.figure.canvas.mpl_connect("axes_leave_event", self._on_ax_leave)
-        ax.figure.canvas.mpl_connect("figure_leave_event", self.on_leave)
+        self.max_fps = max_fps
+        self._motion_handler = None
+        self._pending_motion_event = None
+        self._motion_timer = None
+        self._last_motion_time = 0
+        self._last_motion_key = None
+        self._has_event_loop = has_event_loop(ax.figure.canvas)
+
+        self.dispatcher = get_event_dispatcher(ax.figure)
+        self.dispatcher.subscribe("button_press_event", self._on_button_press)
+        self.dispatcher.subscribe(
+            "button_release_event", self._on_button_release, ax=ax
+        )
+        self.dispatcher.subscribe("axes_leave_event", self._on_ax_leave, ax=ax)
+        self.dispatcher.subscribe("figure_leave_event", self._on_figure_leave)
 
         ax._axes_event_handlers_ref = self
 
+    def connect_motion(self, handler, any_axes=False):
+        """
+        Handle motion events in `self.ax`, or anywhere in the figure if
+        `any_axes` is True, subject to `max_fps`.
+        """
+        self._motion_handler = handler
+        self.dispatcher.subscribe(
+            "motion_notify_event",
+            self._on_motion,
+            ax=None if any_axes else self.ax,
+        )
+
+    def _on_motion(self, event: MouseEvent):
+        if not self.max_fps:
+            self._handle_motion(event)
+            return
+
+        # Any earlier pending event is stale, so is replaced
+        if self._pending_motion_event is not None:
+            count(self.ax.figure, "motion_coalesced")
+        self._pending_motion_event = event
+
+        if self._motion_timer:
+            return  # Already scheduled
+
+        since_last_ms = (time.perf_counter() - self._last_motion_time) * 1000
+        wait_ms = 1000 / self.max_fps - since_last_ms
+
+        if wait_ms <= 0:
+            self._flush_motion()
+        # Without an event loop, timers never fire, so the pending event is
+        # left for the first event after the interval to replace and handle
+        elif self._has_event_loop:
+            self._motion_timer = self.ax.figure.canvas.new_timer(math.ceil(wait_ms))
+            self._motion_timer.single_shot = True
+            self._motion_timer.add_callback(self._flush_motion)
+            self._motion_timer.start()
+
+    def _flush_motion(self):
+        self._motion_timer = None
+        event = self._pending_motion_event
+        self._pending_motion_event = None
+
+        if event is not None:
+            self._last_motion_time = time.perf_counter()
+            self._handle_motion(event)
+
+    def _handle_motion(self, event: MouseEvent):
+        key = self.get_motion_key(event)
+        if key is not None and key == self._last_motion_key:
+            count(self.ax.figure, "motion_skipped")
+            return
+
+        self._last_motion_key = key
+        with profile(self.ax.figure, f"{type(self).__name__}.motion"):
+            self._motion_handler(event)
+
+    def _cancel_motion(self):
+        if self._motion_timer:
+            self._motion_timer.stop()
+            self._motion_timer = None
+        self._pending_motion_event = None
+        self._last_motion_key = None
+
     def _on_button_press(self, event: MouseEvent):
         self._button_press_xy = (event.x, event.y)
 
@@ -33,8 +195,21 @@ class EventsMixin:
 
     def _on_ax_leave(self, event):
         if event.inaxes == self.ax:
+            self._cancel_motion()
             self.on_leave(event)
 
+    def _on_figure_leave(self, event):
+        self._cancel_motion()
+        self.on_leave(event)
+
+    def get_motion_key(self, event: MouseEvent):
+        """
+        Return a value describing what a motion event would show, e.g. the
+        nearest x value. An event with the same key as the last handled event
+        is skipped. The default of None never skips.
+        """
+        return None
+
     def on_left_click(self, event):
         pass
 
@@ -0,0 +1,231 @@
+from matplotlib.axes import Axes
+from matplotlib.backend_bases import MouseEvent
+from matplotlib.lines import Line2D
+import numpy as np
+
+import mpl_utils
+
+
+def _get_line_segments(line: Line2D, pixels: float):
+    xy = line.get_transform().transform(line.get_xydata())
+    valid = np.isfinite(xy).all(axis=1)
+
+    if line.get_linestyle() in ("None", "none", "", " ") or len(xy) < 2:
+        points = xy[valid]
+        return np.hstack([points, points]), np.full(len(points), pixels)
+
+    # Segments between consecutive valid points, plus any isolated points
+    joined = valid[:-1] & valid[1:]
+    segments = np.hstack([xy[:-1][joined], xy[1:][joined]])
+
+    has_prev = np.concatenate([[False], joined])
+    has_next = np.concatenate([joined, [False]])
+    points = xy[valid & ~has_prev & ~has_next]
+    segments = np.vstack([segments, np.hstack([points, points])])
+
+    return segments, np.full(len(segments), pixels)
+
+
+def _get_collection_points(collection, px_per_pt: float):
+    points = collection.get_offset_transform().transform(collection.get_offsets())
+    points = np.asarray(points, dtype=float)
+    sizes = collection.get_sizes()
+    if len(sizes) == 0:
+        sizes = np.zeros(1)
+
+    # Marker sizes are areas in points squared, the pick radius is in pixels
+    marker_radii = np.sqrt(sizes) / 2 * px_per_pt
+    radii = np.resize(marker_radii, len(points)) + collection.get_pickradius()
+
+    valid = np.isfinite(points).all(axis=1)
+    return np.hstack([points, points])[valid], radii[valid]
+
+
+class HitIndex:
+    """
+    A display-space index of the line segments and scatter points in an axes,
+    for finding the artists under the cursor without calling `Artist.contains()`
+    on every artist.
+
+    Segments are bucketed into a grid of square cells covering the axes, so a
+    query only measures distances to the few segments near the cursor.
+    The index is rebuilt when the axes moves or resizes, the view limits
+    change, or the drawn data changes (e.g. new data, or a DecimatedLine zoomed).
+    """
+
+    def __init__(self, ax: Axes, cell_size=32):
+        self.ax = ax
+        self.cell_size = cell_size
+        self.artists = []
+        self._key = None
+        self._xy_arrays = []
+
+        ax._hit_index_ref = self
+
+    def _get_key(self):
+        return (
+            self.ax.bbox.bounds,
+            self.ax.viewLim.bounds,
+            self.ax.get_xscale(),
+            self.ax.get_yscale(),
+            self.ax.figure.dpi,
+        )
+
+    def refresh(self):
+        artists = mpl_utils.get_data_index(self.ax).artists
+        key = self._get_key()
+
+        # What's drawn can differ from the DataIndex data, e.g. DecimatedLine
+        xy_arrays = [
+            artist.get_xydata() if isinstance(artist, Line2D) else artist.get_offsets()
+            for artist in artists
+        ]
+
+        if (
+            key != self._key
+            or artists is not self.artists
+            or any(a is not b for a, b in zip(xy_arrays, self._xy_arrays))
+        ):
+            self._key = key
+            self._xy_arrays = xy_arrays  # Keeping references stops ids being reused
+            self.artists = artists
+            self.build()
+
+        return self
+
+    def build(self):
+        px_per_pt = self.ax.figure.dpi / 72
+
+        segment_arrays = []
+        radius_arrays = []
+        owner_arrays = []
+        for i, artist in enumerate(self.artists):
+            if isinstance(artist, Line2D):
+                pixels = artist.get_pickradius() * px_per_pt
+                segments, radii = _get_line_segments(artist, pixels)
+            else:
+                segments, radii = _get_collection_points(artist, px_per_pt)
+
+            segment_arrays.append(segments.reshape(-1, 4))
+            radius_arrays.append(radii)
+            owner_arrays.append(np.full(len(radii), i))
+
+        if segment_arrays:
+            segments = np.vstack(segment_arrays)
+            radii = np.concatenate(radius_arrays)
+            owners = np.concatenate(owner_arrays)
+        else:
+            segments = np.empty((0, 4))
+            radii = np.empty(0)
+            owners = np.empty(0, dtype=int)
+
+        # The grid covers the axes, queries outside it find nothing
+        x0, y0, width, height = self.ax.bbox.bounds
+        self.origin = np.array([x0, y0])
+        self.n_cols = max(1, int(np.ceil(width / self.cell_size)))
+        self.n_rows = max(1, int(np.ceil(height / self.cell_size)))
+
+        lo = np.minimum(segments[:, :2], segments[:, 2:]) - radii[:, None]
+        hi = np.maximum(segments[:, :2], segments[:, 2:]) + radii[:, None]
+        cell_lo = np.floor((lo - self.origin) / self.cell_size).astype(int)
+        cell_hi = np.floor((hi - self.origin) / self.cell_size).astype(int)
+
+        # Drop segments entirely outside the grid, clip the rest to it
+        limits = np.array([self.n_cols - 1, self.n_rows - 1])
+        inside = (cell_hi >= 0).all(axis=1) & (cell_lo <= limits).all(axis=1)
+        cell_lo = np.clip(cell_lo[inside], 0, limits)
+        cell_hi = np.clip(cell_hi[inside], 0, limits)
+        segment_ids = np.flatnonzero(inside)
+
+        # Add a (cell, segment) entry for every cell a segment's bbox touches
+        spans = cell_hi - cell_lo + 1
+        counts = spans[:, 0] * spans[:, 1]
+        entry_segments = np.repeat(np.arange(len(segment_ids)), counts)
+        starts = np.repeat(np.cumsum(counts) - counts, counts)
+        offsets = np.arange(counts.sum()) - starts
+        entry_widths = spans[entry_segments, 0]
+        cols = cell_lo[entry_segments, 0] + offsets % entry_widths
+        rows = cell_lo[entry_segments, 1] + offsets // entry_widths
+        cells = rows * self.n_cols + cols
+
+        order = np.argsort(cells, kind="stable")
+        self.cell_starts = np.searchsorted(
+            cells[order], np.arange(self.n_cols * self.n_rows + 1)
+        )
+        self.cell_segments = segment_ids[entry_segments[order]]
+
+        self.segments = segments
+        self.radii = radii
+        self.owners = owners
+
+    def _get_cell(self, x, y):
+        col, row = np.floor((np.array([x, y]) - self.origin) / self.cell_size)
+        return int(col), int(row)
+
+    def query(self, x, y, radius=None) -> list:
+        """
+        Return the artists within `radius` pixels of display point (x, y), in
+        axes order. By default each artist's own pick radius is used.
+        Visible artists only.
+        """
+        # An explicit radius can reach segments in neighbouring cells
+        reach = radius or 0
+        col_lo, row_lo = self._get_cell(x - reach, y - reach)
+        col_hi, row_hi = self._get_cell(x + reach, y + reach)
+        col_lo, row_lo = max(col_lo, 0), max(row_lo, 0)
+        col_hi, row_hi = min(col_hi, self.n_cols - 1), min(row_hi, self.n_rows - 1)
+        if col_lo > col_hi or row_lo > row_hi:
+            return []
+
+        id_arrays = []
+        for row in range(row_lo, row_hi + 1):
+            first = self.cell_starts[row * self.n_cols + col_lo]
+            last = self.cell_starts[row * self.n_cols + col_hi + 1]
+            id_arrays.append(self.cell_segments[first:last])
+
+        ids = np.concatenate(id_arrays)
+        if radius is not None:
+            ids = np.unique(ids)
+        if len(ids) == 0:
+            return []
+
+        # Distance from the point to each candidate segment
+        p0 = self.segments[ids, :2]
+        p1 = self.segments[ids, 2:]
+        d = p1 - p0
+        length_sq = (d**2).sum(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            t = ((x - p0[:, 0]) * d[:, 0] + (y - p0[:, 1]) * d[:, 1]) / length_sq
+        t = np.clip(np.nan_to_num(t), 0, 1)
+        closest = p0 + t[:, None] * d
+        dist_sq = (x - closest[:, 0]) ** 2 + (y - closest[:, 1]) ** 2
+
+        radii = self.radii[ids] if radius is None else radius
+        hit_owners = np.unique(self.owners[ids][dist_sq <= radii**2])
+
+        return [
+            self.artists[owner]
+            for owner in hit_owners
+            if self.artists[owner].get_visible()
+        ]
+
+
+def get_hit_index(ax: Axes) -> HitIndex:
+    """
+    Return the up-to-date HitIndex for an axes, creating it if required.
+    """
+    index = getattr(ax, "_hit_index_ref", None) or HitIndex(ax)
+    return index.refresh()
+
+
+def get_artists_at_event(event: MouseEvent, radius=None) -> list:
+    """
+    Return the Line2D and PathCollection artists under the cursor.
+
+    A fast replacement for checking `artist.contains(event)` on every artist
+    in `event.inaxes`. See `HitIndex.query()`.
+    """
+    if not event.inaxes:
+        return []
+
+    return get_hit_index(event.inaxes).query(event.x, event.y, radius=radius)
@@ -1,16 +1,19 @@
 from dataclasses import dataclass
 
+import numpy as np
 import pandas as pd
 from matplotlib import pyplot as plt
 from matplotlib.artist import Artist
 from matplotlib.backend_bases import PickEvent
+from matplotlib.patches import Rectangle
 from matplotlib.text import Text
 
 import mpl_utils
+from mpl_utils.custom_tooltip import Blitter
 
 
 # Added in #505
-class add_interactive_legend:
+class add_interactive_legend(mpl_utils.EventsMixin):
     @dataclass
     class SeriesItem:
         legend_handle: Artist
@@ -19,11 +22,17 @@ class add_interactive_legend:
         original_alpha: float
         visible: bool
 
-    def __init__(self, ax=None, **kwargs):
+    def __init__(self, ax=None, max_fps: float = None, use_blit=True, **kwargs):
+        """
+        With `use_blit`, focusing a series (by hovering its legend text) blits a
+        translucent overlay over the axes and redraws just that series on top,
+        rather than changing the alpha of every series and redrawing.
+        """
         if kwargs.get("reverse"):
             raise ValueError("Reversed legend is not supported")
 
         ax = ax or plt.gca()
+        super().__init__(ax, max_fps=max_fps)
         self.fig = ax.figure
         self.legend = ax.legend(**kwargs)
         self.series_items = {}
@@ -48,8 +57,31 @@ class add_interactive_legend:
                 visible=True,
             )
 
-        self.fig.canvas.mpl_connect("pick_event", self.on_pick)
-        self.fig.canvas.mpl_connect("motion_notify_event", self.on_mouse_move)
+        # Legend text extents, in display pixels, for hit testing
+        self.text_items = [self.series_items[text.get_text()] for text in legend_texts]
+        self.text_extents = None
+
+        self.blitter = None
+        if use_blit and self.fig.canvas.supports_blit:
+            self.blitter = Blitter(self.fig)
+            self.dim_overlay = ax.add_artist(
+                Rectangle(
+                    xy=(0, 0),
+                    width=1,
+                    height=1,
+                    transform=ax.transAxes,
+                    facecolor=ax.get_facecolor(),
+                    alpha=0.8,
+                    animated=True,
+                    in_layout=False,
+                )
+            )
+
+        self.dispatcher.subscribe("draw_event", self.on_draw)
+
+        # The legend can be outside the axes, so handle events anywhere
+        self.dispatcher.subscribe("pick_event", self.on_pick)
+        self.connect_motion(self.on_mouse_move, any_axes=True)
         ax._interactive_legend_ref = self
 
     def on_pick(self, event: PickEvent):
@@ -65,12 +97,27 @@ class add_interactive_legend:
         item.legend_text.set_alpha(1 if visible else 0.2)
         self.fig.canvas.draw_idle()
 
+    def on_draw(self, _):
+        # The Blitter has the new background, so re-apply any focus on top
+        self.text_extents = None
+        if self.blitter and self.focused_item:
+            self.draw_focus()
+
     def on_mouse_move(self, event):
         matching_item = self.get_item_from_event(event)
 
         if matching_item == self.focused_item:
             return
 
+        if self.blitter:
+            self.focused_item = matching_item
+            with mpl_utils.profile(self.fig, "blit"):
+                self.fig.canvas.restore_region(self.blitter.background)
+                if matching_item:
+                    self.draw_focus()
+                self.fig.canvas.blit()
+            return
+
         if matching_item:
             for item in self.series_items.values():
                 item.ax_artist.set_alpha(1 if item is matching_item else 0.2)
@@ -82,14 +129,38 @@ class add_interactive_legend:
 
         self.fig.canvas.draw_idle()
 
+    def draw_focus(self):
+        # Dim everything, then draw the focused series on top
+        self.fig.draw_artist(self.dim_overlay)
+        self.fig.draw_artist(self.focused_item.ax_artist)
+
+        # Then copy back the undimmed legend, rather than drawing every entry.
+        # Agg regions are positioned from the top left.
+        x0, y0, x1, y1 = self.legend.get_window_extent().padded(1).extents
+        height = self.fig.bbox.height
+        self.fig.canvas.restore_region(
+            self.blitter.background,
+            bbox=(x0, height - y1, x1, height - y0),
+            xy=(0, 0),  # Where the (whole figure) background region starts
+        )
+
     def get_item_from_event(self, event):
-        if not self.legend.contains(event)[0]:
+        if not self.legend.get_visible():
             return None
 
+        if self.text_extents is None:
+            renderer = self.fig._get_renderer()
+            self.text_extents = np.array(
+                [text.get_window_extent(renderer).extents for text in self.legend.texts]
+            )
+
         # We'll only use the legend text (not handles)
-        for artist in self.legend.texts:
-            if artist.contains(event)[0]:
-                return self.series_items[artist.get_text()]
+        x0, y0, x1, y1 = self.text_extents.T
+        hits = np.flatnonzero(
+            (x0 <= event.x) & (event.x <= x1) & (y0 <= event.y) & (event.y <= y1)
+        )
+        if len(hits):
+            return self.text_items[hits[0]]
 
 
 if __name__ == "__main__":
@@ -2,9 +2,12 @@ from collections.abc import Sequence
 from typing import Literal, Union
 
 from matplotlib import pyplot as plt
+from matplotlib.axes import Axes
+from matplotlib.layout_engine import ConstrainedLayoutEngine
 from matplotlib.transforms import Bbox
 
 import mpl_utils
+from mpl_utils.profiling import count
 
 
 # Added in #702
@@ -31,6 +34,142 @@ def mixed_to_rel_sizes(sizes, ref_size):
     return px_sizes
 
 
+def get_decoration_key(ax: Axes):
+    """
+    A cheap description of what's drawn around an axes (titles, labels, tick
+    labels, legend entries), to tell when its decorations might change size.
+    """
+    key = [ax.get_visible(), ax.axison, ax.get_title("left"), ax.get_title()]
+    key.append(ax.get_title("right"))
+
+    for axis in (ax.xaxis, ax.yaxis):
+        locs = axis.get_majorticklocs()
+        key.append(axis.get_label_text())
+        key.append(tuple(axis.get_major_formatter().format_ticks(locs)))
+
+    if legend := ax.get_legend():
+        key.append(tuple(text.get_text() for text in legend.get_texts()))
+
+    return tuple(key)
+
+
+def get_figure_decoration_key(fig):
+    """
+    Like `get_decoration_key`, for what's drawn around the figure's axes
+    (suptitle, supxlabel, supylabel and figure legends).
+    """
+    return (
+        fig.get_suptitle(),
+        fig.get_supxlabel(),
+        fig.get_supylabel(),
+        tuple(
+            tuple(text.get_text() for text in legend.get_texts())
+            for legend in fig.legends
+        ),
+    )
+
+
+class FlexLayoutEngine(ConstrainedLayoutEngine):
+    """
+    The constrained layout engine used by `flex_subplots`.
+
+    It converts pixel row heights and column widths to gridspec ratios, but only
+    once a window resize has settled for `debounce_ms`. Until then, the layout
+    isn't solved again, so the axes just stretch with the figure.
+
+    The axes positions from each solve are cached by figure size (and the
+    axes' decorations), so going back to a previous window size is free.
+    """
+
+    def __init__(
+        self,
+        fig,
+        row_heights=None,
+        col_widths=None,
+        debounce_ms=100,
+        max_cached=32,
+    ):
+        super().__init__()
+        self.fig = fig
+        self.grid_spec = fig.axes[0].get_gridspec()
+        self.row_heights = row_heights
+        self.col_widths = col_widths
+        self.debounce_ms = debounce_ms
+        self.max_cached = max_cached
+
+        self.cache = {}  # {layout key: {ax: (original, active position)}}
+        self.timer = None
+        self.resizing = False
+
+        self.set_sizes()
+        fig.canvas.mpl_connect("resize_event", self.on_resize)
+
+    def set_sizes(self):
+        # Setting ratios makes the figure stale, so only set them if they change
+        if self.row_heights is not None:
+            height_ratios = mixed_to_rel_sizes(self.row_heights, self.fig.bbox.height)
+            if height_ratios != self.grid_spec.get_height_ratios():
+                self.grid_spec.set_height_ratios(height_ratios)
+
+        if self.col_widths is not None:
+            width_ratios = mixed_to_rel_sizes(self.col_widths, self.fig.bbox.width)
+            if width_ratios != self.grid_spec.get_width_ratios():
+                self.grid_spec.set_width_ratios(width_ratios)
+
+    def on_resize(self, event=None):
+        self.resizing = True
+
+        if self.timer:
+            self.timer.stop()
+
+        self.timer = self.fig.canvas.new_timer(self.debounce_ms)
+        self.timer.single_shot = True
+        self.timer.add_callback(self.end_resize)
+        self.timer.start()
+
+    def end_resize(self):
+        self.timer = None
+        self.resizing = False
+        self.set_sizes()
+        self.fig.canvas.draw_idle()
+
+    def get_layout_key(self, fig):
+        return (
+            round(fig.bbox.width),
+            round(fig.bbox.height),
+            tuple(self.grid_spec.get_height_ratios() or ()),
+            tuple(self.grid_spec.get_width_ratios() or ()),
+            tuple((ax, get_decoration_key(ax)) for ax in fig.axes),
+            get_figure_decoration_key(fig),
+        )
+
+    def execute(self, fig):
+        with mpl_utils.profile(fig, "layout"):
+            if self.resizing:
+                count(fig, "layout.skipped")
+                return
+
+            key = self.get_layout_key(fig)
+            if positions := self.cache.get(key):
+                for ax, (original, active) in positions.items():
+                    ax._set_position(original, which="original")
+                    ax._set_position(active, which="active")
+                count(fig, "layout.cached")
+                return
+
+            super().execute(fig)
+            count(fig, "layout.solved")
+
+            # Every axes, as the solve also places some without a subplotspec
+            # (e.g. colorbars from `fig.colorbar(..., ax=ax)`)
+            self.cache[key] = {
+                ax: (ax.get_position(original=True), ax.get_position(original=False))
+                for ax in fig.axes
+            }
+            if len(self.cache) > self.max_cached:
+                del self.cache[next(iter(self.cache))]  # The oldest
+
+
 # Added in #702
 def flex_subplots(
     num="Chart",
@@ -52,19 +191,7 @@ def flex_subplots(
     )
     mpl_utils.clear_events()
 
-    grid_spec = fig.axes[0].get_gridspec()
-
-    def set_sizes(event=None):
-        if row_heights is not None:
-            height_ratios = mixed_to_rel_sizes(row_heights, fig.bbox.height)
-            grid_spec.set_height_ratios(height_ratios)
-
-        if col_widths is not None:
-            width_ratios = mixed_to_rel_sizes(col_widths, fig.bbox.width)
-            grid_spec.set_width_ratios(width_ratios)
-
-    set_sizes()
-    fig.canvas.mpl_connect("resize_event", set_sizes)
+    fig.set_layout_engine(FlexLayoutEngine(fig, row_heights, col_widths))
 
     return fig, ax_or_axs
 
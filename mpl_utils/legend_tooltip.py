@@ -2,11 +2,32 @@ from matplotlib import pyplot as plt
 from matplotlib.axes import Axes
 from matplotlib.backend_bases import MouseEvent
 from matplotlib.collections import PathCollection
+from matplotlib.legend import Legend
 from matplotlib.lines import Line2D
 from matplotlib.transforms import IdentityTransform
 import pandas as pd
 
 import mpl_utils
+from mpl_utils.custom_tooltip import Blitter
+
+
+def _copy_style(legend_handle: Line2D, artist):
+    if isinstance(artist, Line2D):
+        legend_handle.set(
+            color=artist.get_color(),
+            linestyle=artist.get_linestyle(),
+            linewidth=artist.get_linewidth(),
+            marker=artist.get_marker(),
+            markerfacecolor=artist.get_markerfacecolor(),
+            markeredgecolor=artist.get_markeredgecolor(),
+        )
+    else:
+        colors = artist.get_facecolor()
+        legend_handle.set(
+            color=colors[0] if len(colors) else artist.get_edgecolor()[0],
+            linestyle="None",
+            marker="o",
+        )
 
 
 # Added in #604
@@ -15,9 +36,12 @@ class add_legend_tooltip(mpl_utils.EventsMixin):
         self,
         ax: Axes = None,
         title_format="{:g}",
+        max_entries=20,
+        use_blit=True,
+        max_fps: float = None,
     ):
         ax = ax or plt.gca()
-        super().__init__(ax)
+        super().__init__(ax, max_fps=max_fps)
         self.ax = ax
         self.title_format = title_format
         self.fig = ax.figure
@@ -26,55 +50,133 @@ class add_legend_tooltip(mpl_utils.EventsMixin):
             for artist in ax.get_children()
             if isinstance(artist, (Line2D, PathCollection))
         ]
-        self.fig.canvas.mpl_connect("motion_notify_event", self.on_mouse_move)
+        self.artist_set = set(self.artists)
+        self.highlighted = set()
+
+        # The legend is created once with a fixed number of rows, which are
+        # restyled, relabelled and shown/hidden as the cursor moves
+        self.legend = Legend(
+            ax,
+            handles=[Line2D([], []) for _ in range(max_entries)],
+            labels=[""] * max_entries,
+            title=" ",
+            shadow=True,
+        )
+        self.legend.set(in_layout=False, visible=False)
+        ax.add_artist(self.legend)
+        self.legend.set_clip_path(None)
+
+        # There's no public access to the legend's rows (a handle and text in
+        # an HPacker), which are hidden to leave out unused entries. Legends
+        # have had this private `_legend_handle_box` (an HPacker of columns,
+        # one here, each a VPacker of rows) since Matplotlib 1.x. This was
+        # checked against Matplotlib 3.11.
+        self.rows = self.legend._legend_handle_box.get_children()[0].get_children()
+
+        if use_blit and self.fig.canvas.supports_blit:
+            self.blitter = Blitter(self.fig, artists=[self.legend])
+        else:
+            self.blitter = None
+
+        self.connect_motion(self.on_mouse_move)
         ax._legend_tooltip_ref = self
 
     def on_mouse_move(self, event: MouseEvent):
         if event.inaxes != self.ax:
             return
 
-        handles = []
-        labels = []
-
-        x_value = mpl_utils.get_closest_x(event)
+        handles = [
+            artist
+            for artist in mpl_utils.get_artists_at_event(event)
+            if artist in self.artist_set
+        ]
 
-        for artist in self.artists:
-            if artist.contains(event)[0]:
-                handles.append(artist)
-                value = mpl_utils.get_y_at_x(artist, x_value)
-                labels.append(f"{artist.get_label()}: {value:g}")
-                artist.set_alpha(1)
-            else:
-                artist.set_alpha(0.07)
+        highlight_changed = self.set_highlighted(handles)
 
         if handles:
-            is_left = event.x < self.fig.bbox.width / 2
-            is_bottom = event.y < self.fig.bbox.height / 2
-            ha = "left" if is_left else "right"
-            va = "lower" if is_bottom else "upper"
-
-            self.ax.legend(
-                handles=handles,
-                labels=labels,
-                title=mpl_utils.bold(self.title_format.format(x_value)),
-                bbox_to_anchor=(event.x, event.y),
-                bbox_transform=IdentityTransform(),
-                loc=f"{va} {ha}",
-                shadow=True,
-            ).set(in_layout=False)
-        else:
-            if legend := self.ax.get_legend():
-                legend.remove()
-            plt.setp(self.artists, alpha=1)
+            self.update_legend(event, handles, restyle=highlight_changed)
+        elif self.legend.get_visible():
+            self.legend.set_visible(False)
+        elif not highlight_changed:
+            return
 
-        self.fig.canvas.draw_idle()
+        self.render(full=highlight_changed)
 
     def on_leave(self, event):
-        if legend := self.ax.get_legend():
-            legend.remove()
-            plt.setp(self.artists, alpha=1)
+        if self.legend.get_visible() or self.highlighted:
+            self.legend.set_visible(False)
+            self.set_highlighted([])
+
+            self.render(full=True)
 
+    def set_highlighted(self, artists) -> bool:
+        """
+        Highlight `artists` by fading out all others, or un-fade everything if
+        `artists` is empty. Only the artists whose state changes are updated.
+        Returns whether anything changed.
+        """
+        highlighted = set(artists)
+
+        if highlighted == self.highlighted:
+            return False
+
+        if bool(highlighted) == bool(self.highlighted):
+            changed = highlighted ^ self.highlighted
+        else:
+            changed = self.artists  # Going to or from no highlight
+
+        for artist in changed:
+            artist.set_alpha(1 if not highlighted or artist in highlighted else 0.07)
+
+        self.highlighted = highlighted
+        return True
+
+    def update_legend(self, event: MouseEvent, handles: list, restyle=True):
+        x_value = mpl_utils.get_closest_x(event)
+        y_values = mpl_utils.get_y_values_at_x(self.ax, x_value)
+
+        overflow = len(handles) - len(self.rows)
+        if overflow > 0:
+            # Use the last row to say how many weren't shown
+            handles = handles[: len(self.rows) - 1]
+
+        for i, (row, legend_handle, text) in enumerate(
+            zip(self.rows, self.legend.legend_handles, self.legend.texts)
+        ):
+            if i < len(handles):
+                artist = handles[i]
+                value = y_values.get(artist, float("nan"))
+                text.set_text(f"{artist.get_label()}: {value:g}")
+                if restyle or not legend_handle.get_visible():
+                    _copy_style(legend_handle, artist)
+                    legend_handle.set_visible(True)
+                row.set_visible(True)
+            elif i == len(handles) and overflow > 0:
+                text.set_text(f"+ {overflow + 1} more")
+                legend_handle.set_visible(False)
+                row.set_visible(True)
+            else:
+                row.set_visible(False)
+
+        is_left = event.x < self.fig.bbox.width / 2
+        is_bottom = event.y < self.fig.bbox.height / 2
+        ha = "left" if is_left else "right"
+        va = "lower" if is_bottom else "upper"
+
+        self.legend.set_title(mpl_utils.bold(self.title_format.format(x_value)))
+        self.legend.set_bbox_to_anchor(
+            (event.x, event.y),
+            transform=IdentityTransform(),
+        )
+        self.legend.set_loc(f"{va} {ha}")
+        self.legend.set_visible(True)
+
+    def render(self, full=False):
+        # Changing the alpha of lines needs a full draw, which also draws the legend
+        if full or not self.blitter:
             self.fig.canvas.draw_idle()
+        else:
+            self.blitter.blit()
 
 
 if __name__ == "__main__":
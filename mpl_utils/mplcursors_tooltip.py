@@ -1,19 +1,45 @@
 from collections.abc import Callable
 from typing import Optional
 
+from matplotlib.axes import Axes
 from matplotlib.collections import PathCollection
+from matplotlib.figure import Figure
 from matplotlib.lines import Line2D
 from matplotlib.patheffects import withSimplePatchShadow
 import matplotlib.pyplot as plt
 import mplcursors
 import pandas as pd
 
+from mpl_utils.series_collection import SeriesCollection
+
+
+def _expand_pickables(pickables):
+    # Like mplcursors does with figures and axes, but leaving out
+    # SeriesCollections, which are as close to the mouse as the line they
+    # draw, so would be picked instead of it
+    for entry in pickables:
+        axs = entry.axes if isinstance(entry, Figure) else [entry]
+        for ax in axs:
+            if not isinstance(ax, Axes):
+                yield ax
+                continue
+            for artist in [*ax.collections, *ax.images, *ax.lines, *ax.patches]:
+                if not isinstance(artist, SeriesCollection):
+                    yield artist
+            yield from [*ax.texts, *ax.artists, *ax.containers]
+
 
 # Added in #605
 def add_mplcursors_tooltip(
     get_text: Callable[[mplcursors.Selection], Optional[str]] = None,
     pickables=None,  # Added in #802
 ):
+    if pickables is None:
+        pickables = [plt.figure(num) for num in plt.get_fignums()]
+    elif isinstance(pickables, (Figure, Axes)):
+        pickables = [pickables]
+    pickables = list(_expand_pickables(pickables))
+
     tooltip_cursor = mplcursors.cursor(
         pickables=pickables,  # Added in #802
         hover=mplcursors.HoverMode.Transient,
@@ -45,6 +71,8 @@ def add_mplcursors_tooltip(
 
         tooltip_cursor.connect("add", set_text)
 
+    return tooltip_cursor
+
 
 if __name__ == "__main__":
     import mpl_utils
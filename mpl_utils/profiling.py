@@ -0,0 +1,155 @@
+from collections import Counter, defaultdict, deque
+import contextlib
+import time
+
+from matplotlib import pyplot as plt
+from matplotlib.figure import Figure
+import numpy as np
+import pandas as pd
+
+
+class add_profiler:
+    """
+    Opt-in timing of a figure's event handlers, draws and blits, to find out
+    where hover lag comes from.
+
+    Once added, the event dispatcher times every handler, and helpers record
+    their own timings (e.g. "blit", "layout") and counts (e.g. motion events
+    coalesced or skipped). Use `summary()` to see the results.
+
+    Parameters
+    ----------
+    fig : Figure, optional
+        The figure to profile. Defaults to the current figure.
+    overlay : bool, default False
+        If True, show frames per second and the latest draw time in the
+        top right of the figure. The text is only updated on full draws, not
+        when helpers blit, so while only blitting it stays as it was (though
+        frames from `Blitter.blit` are still counted in `get_fps()`).
+    max_samples : int, default 1000
+        The number of recent timings kept for each name.
+    """
+
+    def __init__(self, fig: Figure = None, overlay=False, max_samples=1000):
+        self.fig = fig or plt.gcf()
+        self.max_samples = max_samples
+        self.timings = defaultdict(lambda: deque(maxlen=self.max_samples))
+        self.counts = Counter()
+        self.frame_times = deque(maxlen=1000)
+
+        if old_profiler := getattr(self.fig, "_profiler_ref", None):
+            old_profiler.remove()
+
+        # Wrap this figure's draw so that full draws are timed too
+        self._original_draw = self.fig.draw
+        self.fig.draw = self._draw
+
+        self.overlay = None
+        if overlay:
+            self.overlay = self.fig.text(
+                x=0.99,
+                y=0.99,
+                s="",
+                ha="right",
+                va="top",
+                fontsize="small",
+                alpha=0.6,
+                in_layout=False,
+            )
+
+        self.fig._profiler_ref = self
+
+    @contextlib.contextmanager
+    def time(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name].append(time.perf_counter() - start)
+
+    def count(self, name: str, n=1):
+        self.counts[name] += n
+
+    def add_frame(self):
+        self.frame_times.append(time.perf_counter())
+
+    def get_fps(self):
+        now = time.perf_counter()
+        return sum(now - frame_time < 1 for frame_time in self.frame_times)
+
+    def _draw(self, renderer):
+        if self.overlay and self.timings["draw"]:
+            last_draw_ms = self.timings["draw"][-1] * 1000
+            self.overlay.set_text(
+                f"{self.get_fps()} fps | draw {last_draw_ms:.0f} ms"
+            )
+
+        with self.time("draw"):
+            self._original_draw(renderer)
+        self.add_frame()
+
+    def summary(self) -> pd.DataFrame:
+        """
+        Return a DataFrame of timings in milliseconds, one row per name,
+        slowest (by total time) first. Names that were only counted (e.g.
+        "motion_skipped" or "stream.samples") follow, with their total count
+        and no timings.
+        """
+        rows = {}
+        for name, timings in self.timings.items():
+            if not timings:
+                continue
+            timings_ms = np.array(timings) * 1000
+            rows[name] = dict(
+                count=len(timings_ms),
+                mean_ms=timings_ms.mean(),
+                p50_ms=np.percentile(timings_ms, 50),
+                p95_ms=np.percentile(timings_ms, 95),
+                max_ms=timings_ms.max(),
+                total_ms=timings_ms.sum(),
+            )
+
+        for name, n in self.counts.items():
+            rows.setdefault(name, dict(count=n))
+
+        return pd.DataFrame.from_dict(
+            rows,
+            orient="index",
+            columns=["count", "mean_ms", "p50_ms", "p95_ms", "max_ms", "total_ms"],
+        ).sort_values("total_ms", ascending=False)
+
+    def reset(self):
+        self.timings.clear()
+        self.counts.clear()
+        self.frame_times.clear()
+
+    def remove(self):
+        del self.fig.draw  # Back to Figure.draw
+        if self.overlay:
+            with contextlib.suppress(ValueError):  # Already gone if fig cleared
+                self.overlay.remove()
+        if getattr(self.fig, "_profiler_ref", None) is self:
+            del self.fig._profiler_ref
+
+
+def get_profiler(fig: Figure = None):
+    """
+    Return the figure's profiler, or None if `add_profiler` hasn't been used.
+    """
+    fig = fig or plt.gcf()
+    return getattr(fig, "_profiler_ref", None)
+
+
+def profile(fig: Figure, name: str):
+    """
+    A context manager that times its block as `name` if the figure is being
+    profiled, otherwise does nothing.
+    """
+    if profiler := getattr(fig, "_profiler_ref", None):
+        return profiler.time(name)
+    return contextlib.nullcontext()
+
+
+def count(fig: Figure, name: str, n=1):
+    if profiler := getattr(fig, "_profiler_ref", None):
+        profiler.count(name, n)
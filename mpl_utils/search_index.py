@@ -0,0 +1,75 @@
+from collections import defaultdict
+from collections.abc import Iterable
+
+import numpy as np
+
+
+class SearchIndex:
+    """
+    Case-insensitive substring search over a fixed list of strings.
+
+    Keys are lowercased once into a NumPy string array, and each query is a
+    vectorized `find` over the candidates. Candidates are narrowed first:
+    if a query contains the previous query (e.g. one more character was
+    typed), only the previous matches are checked, otherwise, with `trigrams`,
+    only keys that contain every three-character chunk of the query are.
+
+    The trigram index is built on the first query that can use it. It's a
+    Python loop over the keys, so is best skipped for millions of keys.
+    """
+
+    def __init__(self, keys: Iterable[str], trigrams=True):
+        self.keys = np.char.lower(np.array(list(keys), dtype=str))
+        self.trigrams = trigrams
+        self.postings = None  # {trigram: sorted key indexes}
+        self.last_text = None
+        self.last_indexes = None
+
+    def build_postings(self):
+        postings = defaultdict(list)
+        for i, key in enumerate(self.keys.tolist()):
+            for trigram in {key[j : j + 3] for j in range(len(key) - 2)}:
+                postings[trigram].append(i)
+
+        self.postings = {
+            trigram: np.array(indexes) for trigram, indexes in postings.items()
+        }
+
+    def get_candidates(self, text: str):
+        if self.last_text is not None and self.last_text in text:
+            return self.last_indexes
+
+        if not self.trigrams or len(text) < 3:
+            return None  # All keys
+
+        if self.postings is None:
+            self.build_postings()
+
+        trigrams = {text[j : j + 3] for j in range(len(text) - 2)}
+        postings = sorted(
+            (self.postings.get(trigram, np.empty(0, dtype=int)) for trigram in trigrams),
+            key=len,
+        )
+        candidates = postings[0]
+        for indexes in postings[1:]:
+            candidates = np.intersect1d(candidates, indexes, assume_unique=True)
+
+        return candidates
+
+    def search(self, text: str) -> np.ndarray:
+        """
+        Return the (ascending) indexes of the keys containing `text`.
+        """
+        text = text.lower()
+        if text == self.last_text:
+            return self.last_indexes
+
+        candidates = self.get_candidates(text)
+        if candidates is None:
+            indexes = np.flatnonzero(np.char.find(self.keys, text) >= 0)
+        else:
+            indexes = candidates[np.char.find(self.keys[candidates], text) >= 0]
+
+        self.last_text = text
+        self.last_indexes = indexes
+        return indexes
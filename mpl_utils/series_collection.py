@@ -0,0 +1,114 @@
+from functools import partial
+
+from matplotlib.axes import Axes
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
+from matplotlib.lines import Line2D
+
+
+class SeriesCollection(LineCollection):
+    """
+    A LineCollection that draws a set of Line2D series in one draw call.
+
+    The lines stay in the axes, so their labels, data, visibility and alpha
+    work as before for legends, tooltips and the other mpl_utils helpers, but
+    they no longer draw themselves in an axes draw. Instead, on each draw the
+    collection reads the path, color, alpha, width and style of every visible
+    line and draws them all together.
+
+    A line drawn on its own, e.g. with `fig.draw_artist(line)` when blitting,
+    still draws as a normal Line2D.
+    """
+
+    def __init__(self, lines: list[Line2D], **kwargs):
+        super().__init__([], label="_series_collection", **kwargs)
+        self.lines = list(lines)
+
+        # There's one cap style for all the lines. Dashes need their own
+        # (usually butt) caps, while solid lines only lose a little at the ends.
+        line = next((line for line in self.lines if line.is_dashed()), self.lines[0])
+        if line.is_dashed():
+            self.set_capstyle(line.get_dash_capstyle())
+            self.set_joinstyle(line.get_dash_joinstyle())
+        else:
+            self.set_capstyle(line.get_solid_capstyle())
+            self.set_joinstyle(line.get_solid_joinstyle())
+
+        # Draw just before the lines, which then skip their own draw
+        self.set_zorder(min(line.get_zorder() for line in self.lines) - 0.001)
+        self._skip_renderer = None
+        self._skip_lines = set()
+        for line in self.lines:
+            line.draw = partial(self._draw_line, line)
+            # They're clipped to the axes, so this just skips the check when
+            # measuring the axes for layouts
+            line.set_in_layout(False)
+
+    def _draw_line(self, line: Line2D, renderer):
+        if renderer is self._skip_renderer and line in self._skip_lines:
+            self._skip_lines.discard(line)
+            return
+        Line2D.draw(line, renderer)
+
+    def draw(self, renderer):
+        if not self.get_visible():
+            return
+
+        # Lines removed from the axes draw nothing (e.g. after `ax.clear()`)
+        lines = [
+            line for line in self.lines if line.get_visible() and line.axes is self.axes
+        ]
+        self._paths = [line.get_path() for line in lines]
+        self.set_color([to_rgba(line.get_color(), line.get_alpha()) for line in lines])
+        self.set_linewidth([line.get_linewidth() for line in lines])
+        self.set_linestyle([line.get_linestyle() for line in lines])
+        self.set_antialiased([line.get_antialiased() for line in lines])
+
+        self._skip_renderer = renderer
+        self._skip_lines = set(self.lines)
+        super().draw(renderer)
+
+    def contains(self, mouseevent):
+        # Picking is left to the lines themselves
+        return False, {}
+
+    def remove(self):
+        for line in self.lines:
+            del line.draw
+            line.set_in_layout(True)
+        super().remove()
+
+
+def _can_collect(ax: Axes, line: Line2D, max_points: int):
+    return (
+        type(line) is Line2D  # Not e.g. a DecimatedLine, which draws its own data
+        and "draw" not in vars(line)  # Already collected
+        and not line.get_animated()  # E.g. blitted by add_stream
+        and line.get_transform() == ax.transData
+        and line.get_marker() in ("None", "none", "", " ", None)
+        and line.get_drawstyle() == "default"
+        and line.get_path_effects() == []
+        and line.get_clip_on()
+        and line.get_clip_path() is None
+        and len(line.get_xydata()) <= max_points
+    )
+
+
+def collect_series(ax: Axes, min_lines=10, max_points=1000) -> SeriesCollection:
+    """
+    Draw the plain lines in `ax` (no markers, steps or path effects, and at
+    most `max_points` points) with a SeriesCollection, if there are at least
+    `min_lines` of them. Returns the collection, or None.
+
+    Long lines are left alone: Line2D simplifies paths with many points, which
+    collections don't, so they're better off drawn alone (or decimated).
+    """
+    lines = [line for line in ax.get_lines() if _can_collect(ax, line, max_points)]
+    if len(lines) < min_lines:
+        return None
+
+    # Lines only stack with each other if they share a zorder
+    zorder = lines[0].get_zorder()
+    lines = [line for line in lines if line.get_zorder() == zorder]
+
+    return ax.add_collection(SeriesCollection(lines), autolim=False)
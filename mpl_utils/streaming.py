@@ -0,0 +1,240 @@
+from collections.abc import Sequence
+import time
+
+from matplotlib import pyplot as plt
+from matplotlib.axes import Axes
+import numpy as np
+
+import mpl_utils
+from mpl_utils.custom_tooltip import Blitter
+from mpl_utils.event_helpers import has_event_loop
+from mpl_utils.profiling import count
+
+
+def _get_stream_blitter(fig) -> Blitter:
+    # One per figure, so each stream's blit redraws the others' lines too
+    blitter = getattr(fig, "_stream_blitter_ref", None)
+    if blitter is None:
+        blitter = fig._stream_blitter_ref = Blitter(fig)
+        return blitter
+
+    # Lines from a previous run may have been removed, with their axes
+    blitter.artists = [
+        artist for artist in blitter.artists if artist.axes in fig.axes
+    ]
+
+    # After `clear_events()` (e.g. when rerunning a chart), the blitter no
+    # longer recaptures its background on draws, so is replaced
+    dispatcher = mpl_utils.get_event_dispatcher(fig)
+    draw_handlers = dispatcher.subscribers.get("draw_event", {}).get(None, [])
+    if blitter.capture_background not in draw_handlers:
+        blitter = fig._stream_blitter_ref = Blitter(fig, blitter.artists)
+
+    return blitter
+
+
+class add_stream:
+    """
+    Live data for an axes: lines (one per label) whose data is the last
+    `capacity` samples appended with `append()`.
+
+    Samples go into a preallocated ring buffer, so appending is cheap,
+    and the lines are updated from it at most `max_fps` times a second.
+    Each update adds the new samples to (and removes the dropped ones from)
+    the axes' DataIndex, rather than rebuilding it, and sets the data limits to the
+    current window. If the window is outside the view (or the y values only
+    fill a small part of it), the view is moved, with `headroom` to spare
+    on the right, and the figure is redrawn. Otherwise just the lines are
+    blitted.
+
+    Without a GUI event loop (e.g. the Agg backend), updates happen as
+    samples are appended, throttled the same way. Call `render()` to update
+    with any remaining samples.
+
+    Parameters
+    ----------
+    ax : Axes, optional
+        Defaults to the current axes.
+    labels : str or sequence of str, default "_stream"
+        One line is added per label.
+    capacity : int, default 10_000
+        The number of most recent samples kept.
+    max_fps : float, default 30
+        The maximum number of updates per second.
+    headroom : float, default 0.2
+        When the view moves, the x range is extended past the latest sample by
+        this fraction of the window.
+    **kwargs
+        Passed to `ax.plot()` for each line.
+    """
+
+    def __init__(
+        self,
+        ax: Axes = None,
+        labels: str | Sequence[str] = "_stream",
+        capacity=10_000,
+        max_fps: float = 30,
+        headroom=0.2,
+        **kwargs,
+    ):
+        self.ax = ax = ax or plt.gca()
+        self.fig = ax.figure
+        self.capacity = capacity
+        self.min_interval = 1 / max_fps
+        self.headroom = headroom
+
+        labels = [labels] if isinstance(labels, str) else list(labels)
+        self.lines = [
+            ax.plot([], [], label=label, animated=True, **kwargs)[0]
+            for label in labels
+        ]
+        self.blitter = _get_stream_blitter(self.fig)
+        self.blitter.artists.extend(self.lines)
+
+        # Columns are x, then y for each line. With twice the capacity, the
+        # window is always one slice, and only moves back to the start of the
+        # buffer after every `capacity` samples.
+        self.buffer = np.full((2 * capacity, 1 + len(self.lines)), np.nan)
+        self.start = 0
+        self.end = 0
+        self.sample_count = 0  # Ever appended
+        self.rendered_count = 0
+        self.rendered_x = np.empty(0)
+
+        self.static_lim = ax.dataLim.frozen()  # Other artists' limits
+        self.has_event_loop = has_event_loop(self.fig.canvas)
+        self.timer = None
+        self.last_render_time = 0
+
+        ax._stream_ref = self
+
+    def append(self, x, y):
+        """
+        Append one sample (a scalar `x`, and a y value for each line) or
+        several (an array of `x`, and an array of y values for each x).
+        """
+        x = np.atleast_1d(x)
+        if not np.issubdtype(x.dtype, np.number):
+            self.ax.xaxis.update_units(x)  # E.g. datetimes
+            x = self.ax.xaxis.convert_units(x)
+
+        samples = np.column_stack(
+            [
+                np.asarray(x, dtype=float),
+                np.asarray(y, dtype=float).reshape(len(x), len(self.lines)),
+            ]
+        )[-self.capacity :]
+
+        # Keep the samples that still fit in the window
+        n_kept = min(self.end - self.start, self.capacity - len(samples))
+        if self.end + len(samples) > len(self.buffer):
+            self.buffer[:n_kept] = self.buffer[self.end - n_kept : self.end]
+            self.end = n_kept
+        self.start = self.end - n_kept
+
+        self.buffer[self.end : self.end + len(samples)] = samples
+        self.end += len(samples)
+        self.sample_count += len(x)
+        count(self.fig, "stream.samples", len(x))
+
+        self.schedule_render()
+
+    def schedule_render(self):
+        wait = self.last_render_time + self.min_interval - time.perf_counter()
+
+        if not self.has_event_loop:
+            if wait <= 0:
+                self.render()
+            return
+
+        if self.timer:
+            return
+
+        self.timer = self.fig.canvas.new_timer(max(int(wait * 1000), 0))
+        self.timer.single_shot = True
+        self.timer.add_callback(self.render)
+        self.timer.start()
+
+    def render(self):
+        self.timer = None
+        self.last_render_time = time.perf_counter()
+        if self.rendered_count == self.sample_count:
+            return
+
+        with mpl_utils.profile(self.fig, "stream.render"):
+            self.update_lines()
+
+            if self.update_limits() or self.blitter.background is None:
+                self.fig.canvas.draw_idle()
+            else:
+                self.blitter.blit()
+
+    def update_lines(self):
+        window = self.buffer[self.start : self.end]
+        x = window[:, 0]
+        for i, line in enumerate(self.lines, start=1):
+            line.set_data(x, window[:, i])
+
+        # Like list slicing, the new count is capped at the window length
+        n_added = min(self.sample_count - self.rendered_count, len(x))
+        n_removed = len(self.rendered_x) + n_added - len(x)
+
+        if data_index := getattr(self.ax, "_data_index_ref", None):
+            for line in self.lines:
+                data_index.update_artist(
+                    line, x[len(x) - n_added :], self.rendered_x[:n_removed]
+                )
+
+        self.rendered_count = self.sample_count
+        self.rendered_x = x.copy()  # The buffer is overwritten in place
+
+    def update_limits(self) -> bool:
+        """
+        Set the data limits to the current window (and any other artists), and
+        move the view if needed. Returns True if the view changed.
+        """
+        window = self.buffer[self.start : self.end]
+        x_min, x_max = np.nanmin(window[:, 0]), np.nanmax(window[:, 0])
+        y_values = window[:, 1:]
+        if np.isnan(y_values).all():
+            y_min, y_max = np.nan, np.nan
+        else:
+            y_min, y_max = np.nanmin(y_values), np.nanmax(y_values)
+
+        # NaN y values (e.g. all gaps so far) are skipped
+        data_lim = self.static_lim.frozen()
+        data_lim.update_from_data_xy([[x_min, y_min], [x_max, y_max]], ignore=False)
+        self.ax.dataLim.set(data_lim)
+        self.ax.ignore_existing_data_limits = False
+
+        changed = False
+        x_lo, x_hi = self.ax.get_xbound()
+        if self.ax.get_autoscalex_on() and (x_min < x_lo or x_max > x_hi):
+            x_span = x_max - x_min or 1
+            self.ax.set_xbound(x_min, x_max + x_span * self.headroom)
+            changed = True
+
+        y_lo, y_hi = self.ax.get_ybound()
+        if self.ax.get_autoscaley_on() and not np.isnan(y_min):
+            margin = (y_max - y_min) * self.ax.margins()[1] or 0.5
+            y_span = y_max - y_min + 2 * margin
+            if y_min < y_lo or y_max > y_hi or y_hi - y_lo > 2 * y_span:
+                self.ax.set_ybound(y_min - margin, y_max + margin)
+                changed = True
+
+        return changed
+
+
+if __name__ == "__main__":
+    with mpl_utils.chart("Streaming") as ax:
+        stream = ax.stream(["sin", "cos"], capacity=2000)
+
+    mpl_utils.add_dynamic_legend(ax)
+
+    start = time.perf_counter()
+    while plt.fignum_exists("Streaming"):
+        t = time.perf_counter() - start
+        # Samples arrive in batches, as they might from a socket
+        ts = np.linspace(t - 0.01, t, 20)
+        stream.append(ts, np.column_stack([np.sin(ts), np.cos(ts * 1.3) * 2]))
+        plt.pause(0.01)
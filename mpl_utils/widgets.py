@@ -1,11 +1,95 @@
 from collections.abc import Callable
-from typing import Literal
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Literal
 
 from matplotlib import pyplot as plt
 from matplotlib.backend_bases import KeyEvent
+from matplotlib.figure import Figure
 from matplotlib.widgets import TextBox
 
 import mpl_utils
+from mpl_utils.event_helpers import has_event_loop
+
+
+class TextChangeHandler:
+    """
+    Passes a TextBox's text changes to `on_change`, optionally debounced, and
+    optionally with the slow part of the work done on a worker thread.
+
+    With `work`, each change runs `work(text)` on a worker thread, then calls
+    `on_change(text, result)` on the GUI thread, from a canvas timer. Only the
+    latest text's result is used: queued work for older text is cancelled,
+    and results of work that was already running are dropped.
+    `work` mustn't touch matplotlib objects, which aren't thread-safe.
+
+    Without a GUI event loop (e.g. the Agg backend) timers never fire, so
+    changes are handled immediately, on the calling thread.
+    """
+
+    def __init__(
+        self,
+        fig: Figure,
+        on_change: Callable,
+        debounce_ms: int = None,
+        work: Callable[[str], Any] = None,
+        poll_ms=10,
+    ):
+        self.fig = fig
+        self.on_change = on_change
+        self.debounce_ms = debounce_ms
+        self.work = work
+        self.poll_ms = poll_ms
+
+        self.has_event_loop = has_event_loop(fig.canvas)
+        self.executor = ThreadPoolExecutor(max_workers=1) if work else None
+        self.debounce_timer = None
+        self.poll_timer = None
+        self.future = None
+        self.future_text = None
+
+    def __call__(self, text: str):
+        if not (self.debounce_ms and self.has_event_loop):
+            self.start(text)
+            return
+
+        if self.debounce_timer:
+            self.debounce_timer.stop()
+
+        self.debounce_timer = self.fig.canvas.new_timer(self.debounce_ms)
+        self.debounce_timer.single_shot = True
+        self.debounce_timer.add_callback(self.start, text)
+        self.debounce_timer.start()
+
+    def start(self, text: str):
+        self.debounce_timer = None
+
+        if not self.work:
+            self.on_change(text)
+            return
+
+        if not self.has_event_loop:
+            self.on_change(text, self.work(text))
+            return
+
+        if self.future:
+            self.future.cancel()  # Does nothing if already running
+
+        self.future = self.executor.submit(self.work, text)
+        self.future_text = text
+
+        if not self.poll_timer:
+            self.poll_timer = self.fig.canvas.new_timer(self.poll_ms)
+            self.poll_timer.add_callback(self.poll)
+            self.poll_timer.start()
+
+    def poll(self):
+        if self.future is None or not self.future.done():
+            return
+
+        self.poll_timer.stop()
+        self.poll_timer = None
+        future, self.future = self.future, None
+        self.on_change(self.future_text, future.result())
 
 
 def add_text_box(
@@ -19,8 +103,19 @@ def add_text_box(
     ] = "bottom left",
     label="",
     fig=None,
+    debounce_ms: int = None,
+    work: Callable[[str], Any] = None,
     **kwargs,
 ):
+    """
+    Add a TextBox, positioned in pixels (see `add_axes_px`), that calls
+    `on_change(text)` when its text changes.
+
+    If `debounce_ms` is set, `on_change` is only called once typing has paused
+    for that long. If `work` is given, `work(text)` runs on a worker thread
+    and `on_change(text, result)` is called with the result of the latest
+    text only. See `TextChangeHandler`.
+    """
     fig = fig or plt.gcf()
 
     text_box = TextBox(
@@ -31,7 +126,9 @@ def add_text_box(
         **kwargs,
     )
     text_box.cursor.set_color(plt.rcParams["text.color"])
-    text_box.on_text_change(on_change)
+    text_box.on_text_change(
+        TextChangeHandler(fig, on_change, debounce_ms=debounce_ms, work=work)
+    )
 
     def on_key_press(event: KeyEvent):
         if event.key == "escape" and text_box.capturekeystrokes: